@@ -6,14 +6,28 @@ This script manages bidirectional file synchronization between local and remote
 development environments using Mutagen.
 """
 
+import copy
+import hashlib
 import json
+import os
+import re
+import selectors
 import shlex
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import click
@@ -27,6 +41,30 @@ from rich.text import Text
 from rich.live import Live
 from rich import box
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Directory holding this script; resolved once at import
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Default configuration (read-only; copy before modifying)
+_DEFAULTS = MappingProxyType({
+    'local_path': _SCRIPT_DIR.parent,
+    'remote_host': 'rem@192.168.1.67',
+    'remote_path': '/Volumes/ss990Pro2T/github.pie/mshw-fpga-workingdrop2.0/AsgardEmu3',
+    'direction': 'push',
+    'ssh_timeout': 10,
+    'retry_count': 3,
+    'retry_delay': 2
+})
+
+# One ignore-file pattern per line, with comments and surrounding whitespace removed
+_IGNORE_LINE_RE = re.compile(r'^[^\S\n]*([^#\s][^#\n]*?)[^\S\n]*(?:#.*)?$', re.M)
+
 # Initialize colorama for cross-platform color support
 colorama_init()
 
@@ -68,20 +106,20 @@ class SyncConfig:
         if not self.remote_path or self.remote_path.strip() != self.remote_path:
             raise ValueError(f"Invalid remote path: '{self.remote_path}'")
 
-        # Sanitize remote path
-        self.remote_path = shlex.quote(self.remote_path)
-
 
 class ConfigManager:
     """Manages configuration loading and validation"""
 
+    # Parsed config files keyed by path -> (st_mtime_ns, st_size, data)
+    _cache: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+    _cache_max_entries = 100
+
     @classmethod
     def get_config_search_paths(cls) -> list[Path]:
         """Get configuration search paths including script directory"""
-        script_dir = Path(__file__).resolve().parent
         return [
-            script_dir / "mutagen-sync.yml",
-            script_dir / ".mutagen-sync.yml",
+            _SCRIPT_DIR / "mutagen-sync.yml",
+            _SCRIPT_DIR / ".mutagen-sync.yml",
             Path.cwd() / ".mutagen-sync.yml",
             Path.cwd() / "mutagen-sync.yml",
             Path.home() / ".config" / "mutagen" / "sync.yml",
@@ -90,36 +128,110 @@ class ConfigManager:
 
     @classmethod
     def find_config_file(cls) -> Path | None:
-        """Search for configuration file in standard locations"""
+        """Search for configuration file in standard locations
+
+        Each parent directory is listed once with os.scandir instead of
+        stat'ing every candidate path.
+        """
+        dir_entries: dict[Path, set[str]] = {}
         for path in cls.get_config_search_paths():
-            if path.exists():
+            names = dir_entries.get(path.parent)
+            if names is None:
+                try:
+                    with os.scandir(path.parent) as it:
+                        names = {entry.name for entry in it}
+                except OSError:
+                    names = set()
+                dir_entries[path.parent] = names
+
+            if path.name in names:
                 logger.debug(f"Found config file at {path}")
                 return path
         return None
 
+    @classmethod
+    def _read_config_file(cls, config_path: Path) -> dict:
+        """Parse a config file, reusing the cached result if the file is unchanged"""
+        st = config_path.stat()
+        key = str(config_path.resolve())
+
+        cached = cls._cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            cls._cache.move_to_end(key)
+            logger.debug(f"Using cached config for {config_path}")
+            return copy.deepcopy(cached[2])
+
+        config_data = cls._read_sidecar(key, st)
+        if config_data is None:
+            with open(config_path) as f:
+                config_data = yaml.load(f, Loader=SafeLoader)
+            cls._write_sidecar(key, st, config_data)
+
+        cls._cache[key] = (st.st_mtime_ns, st.st_size, config_data)
+        cls._cache.move_to_end(key)
+        if len(cls._cache) > cls._cache_max_entries:
+            cls._cache.popitem(last=False)
+
+        return copy.deepcopy(config_data)
+
+    @staticmethod
+    def _sidecar_path(key: str) -> Path:
+        """Path of the JSON file caching the parsed form of the config at key"""
+        cache_home = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+        name = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return cache_home / 'mutagen-sync' / f'{name}.json'
+
+    @classmethod
+    def _read_sidecar(cls, key: str, st: os.stat_result) -> dict | None:
+        """Load the cached parse if it was written for the current config file"""
+        sidecar = cls._sidecar_path(key)
+        try:
+            with open(sidecar) as f:
+                payload = json.load(f)
+            if (payload['path'] != key or payload['mtime_ns'] != st.st_mtime_ns
+                    or payload['size'] != st.st_size):
+                return None
+            data = payload['data']
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+        logger.debug(f"Loaded parsed config from {sidecar}")
+        return data
+
+    @classmethod
+    def _write_sidecar(cls, key: str, st: os.stat_result, config_data: Any) -> None:
+        """Atomically cache the parsed config, keyed on the file's mtime and size"""
+        sidecar = cls._sidecar_path(key)
+        try:
+            # JSON turns non-string keys into strings and has no dates, so only
+            # cache documents that come back unchanged
+            if json.loads(json.dumps(config_data)) != config_data:
+                logger.debug(f"Not caching {key}: it does not round-trip through JSON")
+                return
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name,
+                                            suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'path': key, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                               'data': config_data}, f)
+                os.replace(tmp_path, sidecar)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            # The cache directory may be unwritable; the sidecar is only an optimization
+            logger.debug(f"Not writing config sidecar {sidecar}: {e}")
+
     @classmethod
     def load_config(cls, config_path: Path | None = None, profile: str = "default") -> SyncConfig:
         """Load configuration from file or use defaults"""
-        script_dir = Path(__file__).resolve().parent
-
-        # Default configuration
-        defaults = {
-            'local_path': script_dir.parent,
-            'remote_host': 'rem@192.168.1.67',
-            'remote_path': '/Volumes/ss990Pro2T/github.pie/mshw-fpga-workingdrop2.0/AsgardEmu3',
-            'direction': 'push',
-            'ssh_timeout': 10,
-            'retry_count': 3,
-            'retry_delay': 2
-        }
-
         if not config_path:
             config_path = cls.find_config_file()
 
         if config_path and config_path.exists():
             try:
-                with open(config_path) as f:
-                    config_data = yaml.safe_load(f)
+                config_data = cls._read_config_file(config_path)
 
                 # Support for multiple profiles
                 if 'profiles' in config_data:
@@ -130,7 +242,7 @@ class ConfigManager:
                     profile_config = config_data
 
                 # Merge with defaults
-                config_dict = {**defaults, **profile_config}
+                config_dict = {**_DEFAULTS, **profile_config}
                 config_dict['profile_name'] = profile
 
                 logger.info(f"Loaded configuration from {config_path} (profile: {profile})")
@@ -141,7 +253,7 @@ class ConfigManager:
                 raise
 
         logger.info("Using default configuration")
-        return SyncConfig(**defaults)
+        return SyncConfig(**_DEFAULTS)
 
     @classmethod
     def save_example_config(cls, path: Path):
@@ -172,20 +284,84 @@ class ConfigManager:
         }
 
         with open(path, 'w') as f:
-            yaml.dump(example_config, f, default_flow_style=False)
+            yaml.dump(example_config, f, Dumper=SafeDumper, default_flow_style=False)
 
         logger.info(f"Saved example configuration to {path}")
 
 
 class SSHConnection:
-    """Manages SSH connectivity and validation"""
-
-    @staticmethod
-    def test_connection(host: str, timeout: int = 10) -> tuple[bool, str]:
+    """Manages SSH connectivity and validation
+
+    All probes share one OpenSSH ControlMaster socket, so only the first
+    command per host pays for the TCP handshake and authentication.
+    """
+
+    def __init__(self, control_path: str | None = None, control_persist: str = "60s"):
+        # None means a socket in a private directory created on first use
+        self.control_path = control_path
+        self.control_persist = control_persist
+        self._control_dir: str | None = None
+        self._seen_hosts: set[str] = set()
+        self._owned_hosts: set[str] = set()
+
+    def _control_path_for(self, host: str) -> str:
+        """ControlPath to use for host, noting whether this instance will own the master"""
+        if self.control_path is None:
+            # mkdtemp gives an unguessable 0700 directory, so no other user can
+            # plant the socket. Keep it under /tmp: ssh appends a random suffix
+            # while binding, and macOS's long $TMPDIR overflows the 104-byte sun_path
+            self._control_dir = tempfile.mkdtemp(
+                prefix='mutagen-sync-', dir='/tmp' if os.path.isdir('/tmp') else None)
+            self.control_path = os.path.join(self._control_dir, '%C')
+
+        if host not in self._seen_hosts:
+            self._seen_hosts.add(host)
+            if self._control_dir is not None or not self._master_running(host):
+                # A caller-supplied path may already hold another process's master
+                self._owned_hosts.add(host)
+        return self.control_path
+
+    def _master_running(self, host: str) -> bool:
+        """Whether a master connection for host is already listening on control_path"""
+        try:
+            result = subprocess.run(['ssh', '-o', f'ControlPath={self.control_path}',
+                                     '-O', 'check', host],
+                                    capture_output=True, timeout=5)
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        return result.returncode == 0
+
+    def _ssh_cmd(self, host: str, timeout: int, *remote_cmd: str,
+                 batch_mode: bool = False) -> list[str]:
+        """Build an ssh command line that reuses the shared master connection"""
+        cmd = ['ssh', '-o', f'ConnectTimeout={timeout}',
+               '-o', 'ControlMaster=auto',
+               '-o', f'ControlPath={self._control_path_for(host)}',
+               '-o', f'ControlPersist={self.control_persist}']
+        if batch_mode:
+            cmd += ['-o', 'BatchMode=yes']
+        return [*cmd, host, *remote_cmd]
+
+    def close(self) -> None:
+        """Shut down the master connections this instance started"""
+        for host in self._owned_hosts:
+            try:
+                subprocess.run(['ssh', '-o', f'ControlPath={self.control_path}',
+                                '-O', 'exit', host],
+                               capture_output=True, timeout=5)
+            except (subprocess.TimeoutExpired, OSError) as e:
+                logger.debug(f"Failed to close SSH master for {host}: {e}")
+        self._seen_hosts.clear()
+        self._owned_hosts.clear()
+        if self._control_dir is not None:
+            shutil.rmtree(self._control_dir, ignore_errors=True)
+            self._control_dir = None
+            self.control_path = None
+
+    def test_connection(self, host: str, timeout: int = 10) -> tuple[bool, str]:
         """Test SSH connection to host"""
         try:
-            cmd = ['ssh', '-o', f'ConnectTimeout={timeout}', '-o', 'BatchMode=yes',
-                   host, 'echo', 'connected']
+            cmd = self._ssh_cmd(host, timeout, 'echo', 'connected', batch_mode=True)
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout + 5)
 
             if result.returncode == 0:
@@ -198,13 +374,13 @@ class SSHConnection:
         except Exception as e:
             return False, f"SSH connection error: {str(e)}"
 
-    @staticmethod
-    def validate_remote_path(host: str, path: str, timeout: int = 10,
+    def validate_remote_path(self, host: str, path: str, timeout: int = 10,
                              create_if_missing: bool = True) -> tuple[bool, str]:
         """Validate that remote path exists, optionally creating it if missing"""
         try:
             # First check if path exists
-            cmd = ['ssh', '-o', f'ConnectTimeout={timeout}', host, 'test', '-d', path]
+            # ssh joins its arguments into one remote shell command, so quote here
+            cmd = self._ssh_cmd(host, timeout, 'test', '-d', shlex.quote(path))
             result = subprocess.run(cmd, capture_output=True, timeout=timeout + 5)
 
             if result.returncode == 0:
@@ -214,7 +390,7 @@ class SSHConnection:
             if create_if_missing:
                 # Try to create the directory
                 logger.info(f"Remote path '{path}' does not exist, attempting to create it...")
-                mkdir_cmd = ['ssh', '-o', f'ConnectTimeout={timeout}', host, 'mkdir', '-p', path]
+                mkdir_cmd = self._ssh_cmd(host, timeout, 'mkdir', '-p', shlex.quote(path))
                 mkdir_result = subprocess.run(mkdir_cmd, capture_output=True, text=True,
                                               timeout=timeout + 5)
 
@@ -232,87 +408,131 @@ class SSHConnection:
         except Exception as e:
             return False, f"Path validation error: {str(e)}"
 
+    def prepare_remote(self, host: str, path: str, timeout: int = 10,
+                       create_if_missing: bool = True) -> tuple[bool, bool, str]:
+        """Check connectivity and the remote path (creating it if requested) in one session
+
+        Returns (success, connected, message) so callers can retry connection
+        failures without retrying deterministic path errors.
+        """
+        script = 'if [ -d "$1" ]; then echo OK; '
+        if create_if_missing:
+            script += 'else mkdir -p "$1" && test -d "$1" && echo CREATED; fi'
+        else:
+            script += 'else exit 1; fi'
+
+        try:
+            # ssh joins its arguments into one remote shell command, so quote here
+            cmd = self._ssh_cmd(host, timeout, 'sh', '-c', shlex.quote(script), '_',
+                                shlex.quote(path), batch_mode=True)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout + 5)
+        except subprocess.TimeoutExpired:
+            return False, False, f"SSH connection timed out after {timeout} seconds"
+        except Exception as e:
+            return False, False, f"SSH connection error: {str(e)}"
+
+        # ssh itself exits with 255 when the connection could not be established
+        if result.returncode == 255:
+            return False, False, f"SSH connection failed: {result.stderr.strip()}"
+
+        status = result.stdout.strip().splitlines()[-1:] if result.returncode == 0 else []
+        if status == ['OK']:
+            return True, True, "Remote path exists"
+        if status == ['CREATED']:
+            logger.info(f"Successfully created remote path: {path}")
+            return True, True, f"Remote path created: {path}"
+
+        if create_if_missing:
+            error_msg = result.stderr.strip() or "Unknown error"
+            return False, True, f"Failed to create remote path '{path}': {error_msg}"
+        return False, True, f"Remote path '{path}' does not exist"
+
 
 class GitignoreParser:
     """Parses and processes .gitignore patterns"""
 
+    DEFAULT_PATTERNS = ('.venv/**', '__pycache__/**', '*.pyc')
+
+    # Binary files we want to sync even if they are gitignored
+    _KEEP_BINARIES: frozenset[str] = frozenset({'*.bit', '*.bin', 'analyzer.csv'})
+
+    # Patterns to skip based on direction (always including the binaries above)
+    _SKIP_BY_DIR: dict[SyncDirection, frozenset[str]] = {
+        SyncDirection.PULL: frozenset({'build/', 'dist/', '*.egg-info/'}) | _KEEP_BINARIES,
+        SyncDirection.PUSH: _KEEP_BINARIES,
+        SyncDirection.BOTH: _KEEP_BINARIES,
+    }
+
+    # Parsed pattern lists shared by all instances, keyed by (ignore file, st_mtime_ns)
+    _global_cache: dict[tuple[str, int], list[str]] = {}
+
     def __init__(self, base_path: Path):
         self.base_path = base_path
-        self._patterns_cache = None
 
-    def read_patterns(self) -> list[str]:
-        """Read and parse .gitignore patterns"""
-        if self._patterns_cache is not None:
-            return self._patterns_cache
+    @staticmethod
+    def _mtime_ns(path: Path) -> int | None:
+        """Return the file's mtime, or None if it does not exist"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
 
-        patterns = ['.venv/**', '__pycache__/**', '*.pyc']  # Default patterns
+    def read_patterns(self) -> list[str]:
+        """Read and parse .gitignore patterns
 
+        Returns a new list on every call; callers may extend it freely.
+        """
         # Check for .mutagenignore first
         mutagenignore_path = self.base_path / '.mutagenignore'
         gitignore_path = self.base_path / '.gitignore'
 
-        if mutagenignore_path.exists():
+        mtime_ns = self._mtime_ns(mutagenignore_path)
+        if mtime_ns is not None:
             # Use .mutagenignore if it exists
-            try:
-                with open(mutagenignore_path) as f:
-                    patterns = []  # Reset patterns when using .mutagenignore
-                    for line in f:
-                        # Remove comments and whitespace
-                        line = line.split('#')[0].strip()
-                        if line and not line.startswith('#'):
-                            patterns.append(line)
-
-                logger.info(f"Using .mutagenignore with {len(patterns)} patterns")
-            except Exception as e:
-                logger.warning(f"Failed to read .mutagenignore: {e}")
-        elif gitignore_path.exists():
-            try:
-                with open(gitignore_path) as f:
-                    for line in f:
-                        # Remove comments and whitespace
-                        line = line.split('#')[0].strip()
-                        if line and not line.startswith('#'):
-                            patterns.append(line)
-
-                logger.debug(f"Loaded {len(patterns)} patterns from .gitignore")
-            except Exception as e:
-                logger.warning(f"Failed to read .gitignore: {e}")
+            ignore_path, use_defaults = mutagenignore_path, False
+        else:
+            mtime_ns = self._mtime_ns(gitignore_path)
+            if mtime_ns is None:
+                return list(self.DEFAULT_PATTERNS)
+            ignore_path, use_defaults = gitignore_path, True
+
+        key = (str(ignore_path), mtime_ns)
+        cached = self._global_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        # Reset patterns when using .mutagenignore
+        patterns = list(self.DEFAULT_PATTERNS) if use_defaults else []
+        try:
+            patterns.extend(_IGNORE_LINE_RE.findall(ignore_path.read_text()))
+        except Exception as e:
+            logger.warning(f"Failed to read {ignore_path.name}: {e}")
+            return patterns
 
-        self._patterns_cache = patterns
-        return patterns
+        if use_defaults:
+            logger.debug(f"Loaded {len(patterns)} patterns from .gitignore")
+        else:
+            logger.info(f"Using .mutagenignore with {len(patterns)} patterns")
+
+        self._global_cache[key] = patterns
+        return list(patterns)
 
     def convert_to_mutagen_patterns(self, patterns: list[str],
                                     direction: SyncDirection) -> list[str]:
         """Convert gitignore patterns to mutagen ignore arguments"""
-        ignore_args = []
-
-        # Patterns to skip based on direction
-        skip_patterns = {
-            SyncDirection.PULL: {'build/', 'dist/', '*.egg-info/'},
-            SyncDirection.PUSH: set(),
-            SyncDirection.BOTH: set()
-        }
-
-        for pattern in patterns:
-            # Skip specific patterns based on direction
-            if pattern in skip_patterns.get(direction, set()):
-                continue
+        skip = self._SKIP_BY_DIR.get(direction, self._KEEP_BINARIES)
+        normalized = [self._normalize(p) for p in patterns if p not in skip]
+        # Skip negation patterns
+        return [arg for p in normalized if not p.startswith('!') for arg in ('--ignore', p)]
 
-            # Skip binary files we want to sync
-            if pattern in ['*.bit', '*.bin', 'analyzer.csv']:
-                continue
-
-            # Format pattern for mutagen
-            if pattern.endswith('/'):
-                pattern = f"{pattern}**"
-            elif pattern.startswith('/'):
-                pattern = pattern[1:]
-
-            # Skip negation patterns
-            if not pattern.startswith('!'):
-                ignore_args.extend(['--ignore', pattern])
-
-        return ignore_args
+    @staticmethod
+    def _normalize(pattern: str) -> str:
+        """Format a gitignore pattern for mutagen"""
+        if pattern.endswith('/'):
+            return f"{pattern}**"
+        if pattern.startswith('/'):
+            return pattern[1:]
+        return pattern
 
 
 class MutagenSync:
@@ -321,11 +541,111 @@ class MutagenSync:
     def __init__(self, config: SyncConfig):
         self.config = config
         self.ssh = SSHConnection()
-        self.gitignore_parser = GitignoreParser(config.local_path)
+        self._gitignore_parser: GitignoreParser | None = None
         self._session_prefix = "fpga-sync"
         self._no_emoji = False
         self._show_full_paths = False
         self._sessions_cache = []
+        self._stop_event = threading.Event()
+        # Set once a mutagen command has confirmed the daemon is running
+        self._daemon_known_up: bool = False
+
+    @property
+    def gitignore_parser(self) -> GitignoreParser:
+        """Parser for the local project's ignore files, created on first use"""
+        if (self._gitignore_parser is None
+                or self._gitignore_parser.base_path != self.config.local_path):
+            self._gitignore_parser = GitignoreParser(self.config.local_path)
+        return self._gitignore_parser
+
+    def __enter__(self) -> "MutagenSync":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release SSH master connections held for validation"""
+        self.ssh.close()
+
+    @contextmanager
+    def _stop_on_sigint(self):
+        """Turn Ctrl+C into a stop request for the wait loops run inside this block"""
+        self._stop_event.clear()
+        try:
+            previous = signal.signal(signal.SIGINT, lambda *_: self._stop_event.set())
+        except ValueError:
+            # Not on the main thread; Ctrl+C keeps its default behaviour
+            previous = None
+        try:
+            yield
+        finally:
+            if previous is not None:
+                signal.signal(signal.SIGINT, previous)
+            # Don't let a stop request from this block cut short a later wait
+            self._stop_event.clear()
+
+    def _iter_status_changes(self, min_interval: float = 2.0) -> Iterator[None]:
+        """Yield once up front, then whenever this profile's sessions report a change
+
+        One long-lived 'mutagen sync monitor' runs per session. Their output is
+        only used as a change signal, so the display is not redrawn on a fixed
+        timer. Redraws are rate-limited to one per min_interval. If no monitor
+        can be started, or they all exit (e.g. sessions were terminated), this
+        falls back to polling every min_interval. Exits when _stop_event is set.
+        """
+        direction = self.config.direction
+        directions = ['push', 'pull'] if direction == SyncDirection.BOTH else [direction.value]
+
+        procs = []
+        sel = selectors.DefaultSelector()
+        try:
+            for name in map(self.get_session_name, directions):
+                proc = subprocess.Popen(['mutagen', 'sync', 'monitor', name],
+                                        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL)
+                procs.append(proc)
+                sel.register(proc.stdout, selectors.EVENT_READ)
+        except (OSError, ValueError) as e:
+            # mutagen missing, or pipes not selectable on this platform
+            logger.debug(f"Falling back to polling for status changes: {e}")
+            for key in list(sel.get_map().values()):
+                sel.unregister(key.fileobj)
+
+        try:
+            yield
+            last_render = time.monotonic()
+            pending = False
+            while not self._stop_event.is_set():
+                if not sel.get_map():
+                    if self._stop_event.wait(min_interval):
+                        break
+                    yield
+                    continue
+
+                wait = max(0.0, last_render + min_interval - time.monotonic()) if pending else 0.5
+                try:
+                    for key, _ in sel.select(wait):
+                        if os.read(key.fd, 65536):
+                            pending = True
+                        else:
+                            sel.unregister(key.fileobj)
+                except OSError as e:
+                    # e.g. WinError 10038: select() only accepts sockets on Windows
+                    logger.debug(f"Falling back to polling for status changes: {e}")
+                    for key in list(sel.get_map().values()):
+                        sel.unregister(key.fileobj)
+
+                if pending and time.monotonic() - last_render >= min_interval:
+                    yield
+                    last_render = time.monotonic()
+                    pending = False
+        finally:
+            sel.close()
+            for proc in procs:
+                proc.terminate()
+                proc.wait()
+                proc.stdout.close()
 
     def validate_environment(self, create_remote_dir: bool = True) -> None:
         """Validate local and remote environments"""
@@ -333,32 +653,31 @@ class MutagenSync:
         if not self.config.local_path.exists():
             raise click.ClickException(f"Local path {self.config.local_path} does not exist")
 
-        # Test SSH connection with retry
-        for attempt in range(self.config.retry_count):
-            success, message = self.ssh.test_connection(
-                self.config.remote_host,
-                self.config.ssh_timeout
-            )
-            if success:
-                logger.info("SSH connection validated")
-                break
-
-            if attempt < self.config.retry_count - 1:
-                logger.warning(f"SSH connection attempt {attempt + 1} failed: {message}")
-                time.sleep(self.config.retry_delay)
-            else:
-                raise click.ClickException(
-                    f"Failed to connect after {self.config.retry_count} attempts: {message}")
-
-        # Validate remote path
-        success, message = self.ssh.validate_remote_path(
-            self.config.remote_host,
-            self.config.remote_path,
-            self.config.ssh_timeout,
-            create_if_missing=create_remote_dir
-        )
-        if not success:
-            raise click.ClickException(message)
+        # Test SSH connection and validate remote path in one round trip, with retry.
+        # Ctrl+C during the retry wait stops the wait rather than raising mid-sleep
+        with self._stop_on_sigint():
+            for attempt in range(self.config.retry_count):
+                success, connected, message = self.ssh.prepare_remote(
+                    self.config.remote_host,
+                    self.config.remote_path,
+                    self.config.ssh_timeout,
+                    create_if_missing=create_remote_dir
+                )
+                if connected:
+                    logger.info("SSH connection validated")
+                    if not success:
+                        raise click.ClickException(message)
+                    break
+
+                if attempt < self.config.retry_count - 1:
+                    logger.warning(f"SSH connection attempt {attempt + 1} failed: {message}")
+                    if self._stop_event.wait(self.config.retry_delay):
+                        raise click.Abort()
+                elif self._stop_event.is_set():
+                    raise click.Abort()
+                else:
+                    raise click.ClickException(
+                        f"Failed to connect after {self.config.retry_count} attempts: {message}")
 
         logger.info("Environment validation successful")
 
@@ -380,31 +699,41 @@ class MutagenSync:
             if b"already running" not in e.stderr:
                 raise click.ClickException(
                     f"Failed to start mutagen daemon: {e.stderr.decode()}") from e
+        self._daemon_known_up = True
 
     def get_session_name(self, direction: str) -> str:
         """Generate session name"""
         return f"{self._session_prefix}-{self.config.profile_name}-{direction}"
 
-    def get_existing_sessions(self) -> dict[str, Any]:
-        """Get information about existing sync sessions"""
+    def get_existing_sessions(self, names: list[str] | None = None) -> dict[str, Any]:
+        """Get information about existing sync sessions
+
+        If names are given, only those sessions are queried from mutagen.
+        """
         try:
-            # First check if daemon is running
-            daemon_check = subprocess.run(
-                ['mutagen', 'daemon', 'status'],
-                capture_output=True,
-                check=False
-            )
+            # First check if daemon is running, unless this process already knows it is
+            if not self._daemon_known_up:
+                daemon_check = subprocess.run(
+                    ['mutagen', 'daemon', 'status'],
+                    capture_output=True,
+                    check=False
+                )
 
-            if daemon_check.returncode != 0:
-                logger.debug("Mutagen daemon not running")
-                return {}
+                if daemon_check.returncode != 0:
+                    logger.debug("Mutagen daemon not running")
+                    return {}
+                self._daemon_known_up = True
 
-            result = subprocess.run(
-                ['mutagen', 'sync', 'list', '--json'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            cmd = ['mutagen', 'sync', 'list', '--json', *(names or [])]
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError:
+                # mutagen fails the whole query if any requested session is missing
+                if not names:
+                    raise
+                if len(names) == 1:
+                    return {}
+                result = subprocess.run(cmd[:4], capture_output=True, text=True, check=True)
 
             if not result.stdout.strip():
                 return {}
@@ -424,16 +753,22 @@ class MutagenSync:
             logger.debug(f"Failed to get existing sessions: {e}")
             return {}
 
-    def create_sync_session(self, direction: SyncDirection, dry_run: bool = False) -> None:
-        """Create a sync session"""
-        session_name = self.get_session_name(direction.value)
-
-        # Get ignore patterns
+    def get_ignore_patterns(self) -> list[str]:
+        """Get ignore-file patterns plus any configured extra patterns"""
         patterns = self.gitignore_parser.read_patterns()
         if self.config.ignore_patterns:
             patterns.extend(self.config.ignore_patterns)
+        return patterns
 
-        ignore_args = self.gitignore_parser.convert_to_mutagen_patterns(patterns, direction)
+    def create_sync_session(self, direction: SyncDirection, dry_run: bool = False,
+                            ignore_args: list[str] | None = None) -> None:
+        """Create a sync session"""
+        session_name = self.get_session_name(direction.value)
+
+        # Get ignore patterns
+        if ignore_args is None:
+            ignore_args = self.gitignore_parser.convert_to_mutagen_patterns(
+                self.get_ignore_patterns(), direction)
 
         # Build command
         if direction == SyncDirection.PUSH:
@@ -475,8 +810,6 @@ class MutagenSync:
         if not dry_run:
             self.start_daemon()
 
-        existing_sessions = self.get_existing_sessions()
-
         # Handle different directions
         directions_to_create = []
         if direction == SyncDirection.BOTH:
@@ -484,6 +817,17 @@ class MutagenSync:
         else:
             directions_to_create = [direction]
 
+        existing_sessions = self.get_existing_sessions(
+            [self.get_session_name(d.value) for d in directions_to_create])
+
+        # Read the ignore files once and convert per direction
+        patterns = self.get_ignore_patterns()
+        ignore_args_by_direction = {
+            d: self.gitignore_parser.convert_to_mutagen_patterns(patterns, d)
+            for d in directions_to_create
+        }
+
+        to_create = []
         for dir_to_create in directions_to_create:
             session_name = self.get_session_name(dir_to_create.value)
 
@@ -495,7 +839,22 @@ class MutagenSync:
             if session_name in existing_sessions and force:
                 self.terminate_session(session_name)
 
-            self.create_sync_session(dir_to_create, dry_run)
+            to_create.append(dir_to_create)
+
+        if len(to_create) > 1 and not dry_run:
+            # Overlap the SSH setup of the push and pull sessions
+            with ThreadPoolExecutor(max_workers=len(to_create)) as executor:
+                futures = [
+                    executor.submit(self.create_sync_session, d, dry_run,
+                                    ignore_args=ignore_args_by_direction[d])
+                    for d in to_create
+                ]
+            for future in futures:
+                future.result()
+        else:
+            for dir_to_create in to_create:
+                self.create_sync_session(dir_to_create, dry_run,
+                                         ignore_args=ignore_args_by_direction[dir_to_create])
 
         if not dry_run:
             self.show_status()
@@ -579,16 +938,20 @@ class MutagenSync:
                 click.secho(f"✗ Failed to resume {session_name}", fg='red')
 
     def show_status(self, watch: bool = False) -> None:
-        """Show sync status"""
+        """Show sync status
+
+        In watch mode the display is redrawn when 'mutagen sync monitor' reports a
+        change, at most once every 2 seconds of wall-clock time. Between redraws
+        the loop blocks in select() or on an Event, so Ctrl+C exits at once. That
+        idle time appears in wall-time profiles but not in CPU-time ones.
+        """
         if watch:
-            try:
-                while True:
+            with self._stop_on_sigint(), closing(self._iter_status_changes()) as changes:
+                for _ in changes:
                     click.clear()
                     self._display_formatted_status()
                     click.secho("\nPress Ctrl+C to exit watch mode", fg='yellow')
-                    time.sleep(2)
-            except KeyboardInterrupt:
-                click.echo("\nExiting watch mode")
+            click.echo("\nExiting watch mode")
         else:
             self._display_formatted_status()
 
@@ -727,14 +1090,12 @@ class MutagenSync:
     def show_status_table(self, watch: bool = False) -> None:
         """Show status in compact table format using rich"""
         if watch:
-            try:
-                with Live(self._create_table_with_paths(), refresh_per_second=0.5,
-                          console=console) as live:
-                    while True:
-                        time.sleep(2)
+            with self._stop_on_sigint(), closing(self._iter_status_changes()) as changes:
+                next(changes)
+                with Live(self._create_table_with_paths(), refresh_per_second=0.5, console=console) as live:
+                    for _ in changes:
                         live.update(self._create_table_with_paths())
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Exiting watch mode[/yellow]")
+            console.print("\n[yellow]Exiting watch mode[/yellow]")
         else:
             console.print(self._create_table_with_paths())
 
@@ -1084,14 +1445,12 @@ class MutagenSync:
     def show_status_minimal(self, watch: bool = False) -> None:
         """Show status in minimal format using rich"""
         if watch:
-            try:
-                with Live(self._create_minimal_panel(), refresh_per_second=0.5,
-                          console=console) as live:
-                    while True:
-                        time.sleep(2)
+            with self._stop_on_sigint(), closing(self._iter_status_changes()) as changes:
+                next(changes)
+                with Live(self._create_minimal_panel(), refresh_per_second=0.5, console=console) as live:
+                    for _ in changes:
                         live.update(self._create_minimal_panel())
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Exiting watch mode[/yellow]")
+            console.print("\n[yellow]Exiting watch mode[/yellow]")
         else:
             console.print(self._create_minimal_panel())
 
@@ -1262,7 +1621,16 @@ def cli(ctx, config, profile, verbose):
 
     # Load configuration
     config_path = Path(config) if config else None
-    ctx.obj = ConfigManager.load_config(config_path, profile)
+    ctx.obj = {'config': ConfigManager.load_config(config_path, profile), 'manager': None}
+
+
+def get_manager(ctx: click.Context) -> MutagenSync:
+    """Return the MutagenSync shared by all commands of this invocation"""
+    if ctx.obj['manager'] is None:
+        manager = MutagenSync(ctx.obj['config'])
+        ctx.find_root().call_on_close(manager.close)
+        ctx.obj['manager'] = manager
+    return ctx.obj['manager']
 
 
 @cli.command()
@@ -1281,10 +1649,12 @@ def cli(ctx, config, profile, verbose):
               help='Show what would be done without doing it')
 @click.option('--no-create-remote', is_flag=True,
               help='Do not create remote directory if it does not exist')
-@click.pass_obj
-def start(config, local_path, remote_host, remote_path, direction, force, dry_run,
+@click.pass_context
+def start(ctx, local_path, remote_host, remote_path, direction, force, dry_run,
           no_create_remote):
     """Start sync session(s)"""
+    config = ctx.obj['config']
+
     # Override config with CLI options
     if local_path:
         config.local_path = Path(local_path).resolve()
@@ -1295,7 +1665,7 @@ def start(config, local_path, remote_host, remote_path, direction, force, dry_ru
     if direction:
         config.direction = SyncDirection(direction)
 
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager.start_sync(force=force, dry_run=dry_run, create_remote_dir=not no_create_remote)
 
 
@@ -1303,13 +1673,14 @@ def start(config, local_path, remote_host, remote_path, direction, force, dry_ru
 @click.option('--direction', '-d',
               type=click.Choice(['push', 'pull', 'both']),
               help='Sync direction to stop')
-@click.pass_obj
-def stop(config, direction):
+@click.pass_context
+def stop(ctx, direction):
     """Stop sync session(s)"""
+    config = ctx.obj['config']
     if direction:
         config.direction = SyncDirection(direction)
 
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager.stop_sync()
 
 
@@ -1319,13 +1690,14 @@ def stop(config, direction):
               help='Sync direction to restart')
 @click.option('--force', '-f', is_flag=True,
               help='Force recreate sessions')
-@click.pass_obj
-def restart(config, direction, force):
+@click.pass_context
+def restart(ctx, direction, force):
     """Restart sync session(s)"""
+    config = ctx.obj['config']
     if direction:
         config.direction = SyncDirection(direction)
 
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager.stop_sync()
     time.sleep(1)  # Brief pause between stop and start
     sync_manager.start_sync(force=force)
@@ -1334,10 +1706,10 @@ def restart(config, direction, force):
 @cli.command()
 @click.option('--watch', '-w', is_flag=True,
               help='Continuously watch status')
-@click.pass_obj
-def status(config, watch):
+@click.pass_context
+def status(ctx, watch):
     """Show sync status with full paths and summary table"""
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager.show_status_table(watch=watch)
 
 
@@ -1346,10 +1718,10 @@ def status(config, watch):
               help='Continuously watch status')
 @click.option('--no-emoji', is_flag=True,
               help='Disable emoji icons in output')
-@click.pass_obj
-def status1(config, watch, no_emoji):
+@click.pass_context
+def status1(ctx, watch, no_emoji):
     """Show sync status (detailed view with boxes)"""
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager._no_emoji = no_emoji
     sync_manager.show_status(watch=watch)
 
@@ -1357,10 +1729,10 @@ def status1(config, watch, no_emoji):
 @cli.command()
 @click.option('--watch', '-w', is_flag=True,
               help='Continuously watch status')
-@click.pass_obj
-def status2(config, watch):
+@click.pass_context
+def status2(ctx, watch):
     """Show sync status (minimal view)"""
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager.show_status_minimal(watch=watch)
 
 
@@ -1368,13 +1740,14 @@ def status2(config, watch):
 @click.option('--direction', '-d',
               type=click.Choice(['push', 'pull', 'both']),
               help='Sync direction to pause')
-@click.pass_obj
-def pause(config, direction):
+@click.pass_context
+def pause(ctx, direction):
     """Pause sync session(s)"""
+    config = ctx.obj['config']
     if direction:
         config.direction = SyncDirection(direction)
 
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager.pause_sync()
 
 
@@ -1382,23 +1755,25 @@ def pause(config, direction):
 @click.option('--direction', '-d',
               type=click.Choice(['push', 'pull', 'both']),
               help='Sync direction to resume')
-@click.pass_obj
-def resume(config, direction):
+@click.pass_context
+def resume(ctx, direction):
     """Resume sync session(s)"""
+    config = ctx.obj['config']
     if direction:
         config.direction = SyncDirection(direction)
 
-    sync_manager = MutagenSync(config)
+    sync_manager = get_manager(ctx)
     sync_manager.resume_sync()
 
 
 @cli.command()
 @click.option('--session', '-s', required=True,
               help='Session name to monitor')
-@click.pass_obj
-def monitor(config, session):
+@click.pass_context
+def monitor(ctx, session):
     """Monitor a specific sync session"""
-    sync_manager = MutagenSync(config)
+    config = ctx.obj['config']
+    sync_manager = get_manager(ctx)
     full_session_name = f"{sync_manager._session_prefix}-{config.profile_name}-{session}"
     sync_manager.monitor_sync(full_session_name)
 
@@ -1419,9 +1794,10 @@ def init(output):
 
 
 @cli.command()
-@click.pass_obj
-def info(config):
+@click.pass_context
+def info(ctx):
     """Show current configuration"""
+    config = ctx.obj['config']
     click.secho("=== Current Configuration ===", fg='blue', bold=True)
     click.echo(f"Profile: {config.profile_name}")
     click.echo(f"Local Path: {config.local_path}")
@@ -1432,8 +1808,7 @@ def info(config):
     click.echo(f"Retry Count: {config.retry_count}")
 
     # Show gitignore patterns
-    parser = GitignoreParser(config.local_path)
-    patterns = parser.read_patterns()
+    patterns = get_manager(ctx).gitignore_parser.read_patterns()
     click.echo(f"\nIgnore Patterns ({len(patterns)} total):")
     for pattern in patterns[:10]:  # Show first 10
         click.echo(f"  - {pattern}")
@@ -3,61 +3,124 @@
 Simplified Mutagen Sync Manager for FPGA Development
 """
 
+import copy
+import functools
+import itertools
 import json
+import os
+import re
+import selectors
+import shutil
 import subprocess
 import sys
 import time
+from collections.abc import Iterator
+from contextlib import closing
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 import click
-import yaml
 from loguru import logger
-from rich.console import Console
-from rich.table import Table
-from rich import box
+
+# rich and yaml are imported where used to keep CLI start-up cheap
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+_MODULE_DIR = Path(__file__).resolve().parent
+_DEFAULT_LOCAL = _MODULE_DIR.parent
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a YAML config file; cached per (path, mtime) so edits invalidate it"""
+    import yaml
+    
+    with open(path_str) as f:
+        return yaml.safe_load(f)
+
+
+@functools.lru_cache(maxsize=8)
+def _find_config(cwd: str) -> Path | None:
+    """Find the first config file in the search dirs; cached per working directory"""
+    search = [
+        (_MODULE_DIR, "mutagen-sync.yml"),
+        (Path(cwd), ".mutagen-sync.yml"),
+    ]
+    for directory, name in search:
+        try:
+            with os.scandir(directory) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            continue
+        if name in names:
+            return directory / name
+    return None
+
+
+# Field patterns for `mutagen sync list` output, applied per session block
+_NAME_RE = re.compile(r'^[^\S\n]*Name:[^\S\n]*(?P<name>.*?)[^\S\n]*$', re.M)
+_STATUS_RE = re.compile(r'^[^\S\n]*Status:[^\S\n]*(.*?)[^\S\n]*$', re.M)
+_URL_RE = re.compile(r'^[^\S\n]*URL:[^\S\n]*(.*?)[^\S\n]*$', re.M)
+_FILES_RE = re.compile(r'^[^\S\n]*(?![^\S\n]|(?:Status|URL):)(.*files.*?)[^\S\n]*$', re.M)
+_CONFLICTS_RE = re.compile(r'^.*conflicts:.*$', re.M | re.I)
+_CONFLICT_LINE_RE = re.compile(
+    r'^[^\S\n]*(?![^\S\n]|(?:Status|URL):|.*conflicts:)(.*?)[^\S\n]*$', re.M | re.I
+)
+_FILE_COUNT_RE = re.compile(r'(\d+)\s+files')
+
+
+class Session(NamedTuple):
+    """One sync session as shown by `mutagen sync list`"""
+    name: str = 'Unknown'
+    status: str = 'Unknown'
+    source: str = 'N/A'
+    target: str = 'N/A'
+    file_info: str = ''
+    conflicts: tuple = ()
 
 
 # Status display functions
-def parse_sessions(output: str) -> list[dict]:
-    """Parse mutagen sync list output into session dictionaries"""
+def parse_sessions(output: str) -> list[Session]:
+    """Parse mutagen sync list output into sessions"""
     sessions = []
-    current_session = {}
-    lines = output.strip().split('\n')
-    conflicts = []
-    in_conflicts = False
+    starts = list(_NAME_RE.finditer(output))
     
-    for line in lines:
-        line = line.strip()
-        if line.startswith('Name:'):
-            if current_session:
-                if conflicts:
-                    current_session['conflicts'] = conflicts
-                    conflicts = []
-                sessions.append(current_session)
-                in_conflicts = False
-            current_session = {'name': line.split(':', 1)[1].strip()}
-        elif line.startswith('Status:'):
-            current_session['status'] = line.split(':', 1)[1].strip()
-        elif line.startswith('URL:') and 'source' not in current_session:
-            current_session['source'] = line.split(':', 1)[1].strip()
-        elif line.startswith('URL:') and 'target' not in current_session:
-            current_session['target'] = line.split(':', 1)[1].strip()
-        elif 'files' in line and 'file_info' not in current_session:
-            current_session['file_info'] = line.strip()
-        elif 'Conflicts:' in line or 'conflicts:' in line.lower():
-            in_conflicts = True
-        elif in_conflicts and line and not line.startswith(('Name:', 'Status:', 'URL:')):
-            # Capture conflict file paths
-            if line.startswith(('- ', '* ', '• ')) or (line and not line.endswith(':')):
-                conflict_path = line.lstrip('- *•').strip()
-                if conflict_path:
-                    conflicts.append(conflict_path)
-    
-    if current_session:
-        if conflicts:
-            current_session['conflicts'] = conflicts
-        sessions.append(current_session)
+    for i, match in enumerate(starts):
+        end = starts[i + 1].start() if i + 1 < len(starts) else len(output)
+        block = output[match.end():end]
+        fields = {'name': match['name']}
+        
+        statuses = _STATUS_RE.findall(block)
+        if statuses:
+            fields['status'] = statuses[-1]
+        
+        urls = _URL_RE.findall(block)
+        if urls:
+            fields['source'] = urls[0]
+        if len(urls) > 1:
+            fields['target'] = urls[1]
+        
+        files_match = _FILES_RE.search(block)
+        if files_match:
+            fields['file_info'] = files_match[1]
+        
+        # Capture conflict file paths listed after the Conflicts: header
+        conflicts_match = _CONFLICTS_RE.search(block)
+        if conflicts_match:
+            files_pos = files_match.start() if files_match else -1
+            lines = [m[1] for m in _CONFLICT_LINE_RE.finditer(block, conflicts_match.end())
+                     if m.start() != files_pos]
+            conflicts = [
+                path for path in (
+                    line.lstrip('- *•').strip() for line in lines
+                    if line.startswith(('- ', '* ', '• ')) or not line.endswith(':')
+                )
+                if path
+            ]
+            fields['conflicts'] = tuple(conflicts)
+        
+        sessions.append(Session(**fields))
     
     return sessions
 
@@ -79,9 +142,10 @@ def format_status(status: str, has_conflicts: bool = False) -> str:
         return status
 
 
-def create_status_table(sessions: list[dict], verbose: bool = False) -> Table:
+def create_status_table(sessions: list[Session], verbose: bool = False) -> "Table":
     """Create a formatted table from sessions"""
-    import re
+    from rich import box
+    from rich.table import Table
     
     table = Table(title="Mutagen Sync Status", box=box.ROUNDED)
     table.add_column("Session", style="cyan")
@@ -91,10 +155,7 @@ def create_status_table(sessions: list[dict], verbose: bool = False) -> Table:
     table.add_column("Status", justify="center")
     
     for session in sessions:
-        name = session.get('name', 'Unknown')
-        source = session.get('source', 'N/A')
-        target = session.get('target', 'N/A')
-        status = session.get('status', 'Unknown')
+        name, status, source, target = session.name, session.status, session.source, session.target
         
         # Format paths
         if verbose:
@@ -103,21 +164,17 @@ def create_status_table(sessions: list[dict], verbose: bool = False) -> Table:
             remote_path = target
         else:
             # Show abbreviated paths
-            local_path = source.split('/')[-1] if '/' in source else source
+            local_path = source.rpartition('/')[2] or source
             remote_parts = target.split(':') if ':' in target else [target]
             remote_host = remote_parts[0].split('@')[-1] if '@' in remote_parts[0] else remote_parts[0]
             remote_path = remote_host
         
         # Extract file count
-        file_info = session.get('file_info', '')
-        file_count = 'N/A'
-        if 'files' in file_info:
-            match = re.search(r'(\d+)\s+files', file_info)
-            if match:
-                file_count = match.group(1)
+        match = _FILE_COUNT_RE.search(session.file_info)
+        file_count = match.group(1) if match else 'N/A'
         
         # Format status
-        has_conflicts = bool(session.get('conflicts'))
+        has_conflicts = bool(session.conflicts)
         status_display = format_status(status, has_conflicts)
         
         table.add_row(name, local_path, remote_path, file_count, status_display)
@@ -125,19 +182,76 @@ def create_status_table(sessions: list[dict], verbose: bool = False) -> Table:
     return table
 
 
+# Template making `mutagen sync monitor` emit one JSON document per update
+MONITOR_TEMPLATE = '{{json .}}\n'
+
+# Template making `mutagen sync list` print just the session names, one per line
+SESSION_NAMES_TEMPLATE = '{{range .}}{{.Name}}\n{{end}}'
+
+# Idle wakeup schedule for the monitor loop: (idle ticks reached, wait in seconds)
+MONITOR_BACKOFF = ((0, 0.05), (4, 0.1), (20, 0.5))
+
+
+def _endpoint_url(endpoint: dict) -> str:
+    """Rebuild the `[user@]host:path` URL shown by `mutagen sync list`"""
+    path = endpoint.get('path', '')
+    host = endpoint.get('host')
+    if not host:
+        return path
+    user = endpoint.get('user')
+    return f"{user}@{host}:{path}" if user else f"{host}:{path}"
+
+
+def session_from_json(record: dict) -> Session:
+    """Convert a mutagen JSON session record to the Session returned by parse_sessions"""
+    alpha = record.get('alpha', {})
+    return Session(
+        name=record.get('name', 'Unknown'),
+        status=record.get('status', 'Unknown'),
+        source=_endpoint_url(alpha),
+        target=_endpoint_url(record.get('beta', {})),
+        file_info=f"{alpha['files']} files" if 'files' in alpha else '',
+        conflicts=tuple(c.get('root', '') for c in record.get('conflicts') or []),
+    )
+
+
+def monitor_wait(idle_ticks: int) -> float:
+    """Stepped backoff for idle wakeups while waiting on monitor output"""
+    wait = MONITOR_BACKOFF[0][1]
+    for threshold, step_wait in MONITOR_BACKOFF:
+        if idle_ticks >= threshold:
+            wait = step_wait
+    return wait
+
+
+# Top-level directories and file extensions turned into ignore patterns
+DIR_IGNORES = frozenset({'.venv', '__pycache__', '.git', 'build', 'dist'})
+EXT_IGNORES = frozenset({'pyc', 'pyo', 'so'})
+
+
 class MutagenSync:
     """Manages mutagen sync sessions with git integration"""
     
     def __init__(self, config_path: Optional[Path] = None, profile: str = "default", verbose: bool = False):
         self.config = self._load_config(config_path, profile)
         self.session_name = f"fpga-sync-{profile}"
-        self.console = Console()
+        self._mutagenignore_path = self.config['local_path'] / '.mutagenignore'
         self.verbose = verbose
+        # Resolve binaries once rather than searching PATH on every spawn
+        self._mutagen_bin = shutil.which('mutagen')
+        self._ssh_bin = shutil.which('ssh')
         
+    @functools.cached_property
+    def console(self) -> "Console":
+        """Rich console, created on first use"""
+        from rich.console import Console
+        
+        return Console()
+    
     def _load_config(self, config_path: Optional[Path], profile: str) -> dict:
         """Load configuration from file or use defaults"""
         defaults = {
-            'local_path': Path(__file__).parent.parent,
+            'local_path': _DEFAULT_LOCAL,
             'remote_host': 'rem@192.168.1.67',
             'remote_path': '/Volumes/ss990Pro2T/github.pie/horizon/horizon-soc-fpga',
             'profile': profile
@@ -145,27 +259,21 @@ class MutagenSync:
         
         # Search for config file
         if not config_path:
-            search_paths = [
-                Path(__file__).parent / "mutagen-sync.yml",
-                Path.cwd() / ".mutagen-sync.yml",
-            ]
-            for path in search_paths:
-                if path.exists():
-                    config_path = path
-                    break
+            config_path = _find_config(os.getcwd())
         
         if config_path and config_path.exists():
-            with open(config_path) as f:
-                data = yaml.safe_load(f)
-                if 'profiles' in data and profile in data['profiles']:
-                    config = {**defaults, **data['profiles'][profile]}
-                else:
-                    config = {**defaults, **data}
-                # Convert local_path to Path if it's a string
-                if isinstance(config['local_path'], str):
-                    config['local_path'] = Path(config['local_path'])
-                logger.info(f"Loaded config from {config_path} (profile: {profile})")
-                return config
+            st = config_path.stat()
+            # Copy so callers can't mutate the cached parse
+            data = copy.deepcopy(_load_yaml_cached(str(config_path.resolve()), st.st_mtime_ns))
+            if 'profiles' in data and profile in data['profiles']:
+                config = {**defaults, **data['profiles'][profile]}
+            else:
+                config = {**defaults, **data}
+            # Convert local_path to Path if it's a string
+            if isinstance(config['local_path'], str):
+                config['local_path'] = Path(config['local_path'])
+            logger.info(f"Loaded config from {config_path} (profile: {profile})")
+            return config
         
         logger.info("Using default configuration")
         return defaults
@@ -175,14 +283,22 @@ class MutagenSync:
         patterns = []
         
         # Check for .mutagenignore first
-        mutagenignore = self.config['local_path'] / '.mutagenignore'
-        if mutagenignore.exists():
-            with open(mutagenignore) as f:
+        if self._mutagenignore_path.exists():
+            with open(self._mutagenignore_path) as f:
                 patterns = [line.strip() for line in f 
                            if line.strip() and not line.startswith('#')]
             logger.info(f"Using .mutagenignore with {len(patterns)} patterns")
             return patterns
         
+        # Use the gitignore rules as-is; walking the tree with git ls-files is opt-in
+        if not self.config.get('deep_ignore_scan'):
+            patterns = self._read_git_excludes()
+            if patterns:
+                patterns.extend(['.git/**', '.env'])
+            else:
+                patterns = ['.git/**', '.venv/**', '__pycache__/**', '*.pyc', '.env']
+            return list(dict.fromkeys(patterns))
+        
         # Use git to find what should be ignored
         try:
             # Get all ignored files
@@ -197,28 +313,15 @@ class MutagenSync:
             if result.stdout.strip():
                 # Extract patterns from ignored files
                 ignored_files = result.stdout.strip().split('\n')
-                seen_dirs = set()
-                seen_extensions = set()
+                names = [path.rpartition('/')[2] for path in ignored_files]
+                firsts = {path.partition('/')[0] for path in ignored_files}
+                exts = {name.rpartition('.')[2] for name in names if '.' in name}
                 
-                for path in ignored_files:
-                    parts = path.split('/')
-                    
-                    # Add directory patterns
-                    if parts[0] not in seen_dirs:
-                        if parts[0] in ['.venv', '__pycache__', '.git', 'build', 'dist']:
-                            patterns.append(f"{parts[0]}/**")
-                            seen_dirs.add(parts[0])
-                    
-                    # Add extension patterns
-                    if '.' in parts[-1]:
-                        ext = parts[-1].split('.')[-1]
-                        if ext in ['pyc', 'pyo', 'so'] and f"*.{ext}" not in seen_extensions:
-                            patterns.append(f"*.{ext}")
-                            seen_extensions.add(f"*.{ext}")
-                    
-                    # Handle files with commas - add as exact paths
-                    if ',' in parts[-1]:
-                        patterns.append(path)
+                patterns = [f"{d}/**" for d in sorted(firsts & DIR_IGNORES)]
+                patterns += [f"*.{ext}" for ext in sorted(exts & EXT_IGNORES)]
+                # Files with commas - add as exact paths
+                patterns += [path for path, name in zip(ignored_files, names, strict=True)
+                             if ',' in name]
             
             # Essential patterns
             patterns.extend(['.git/**', '.env'])
@@ -227,18 +330,81 @@ class MutagenSync:
             # Fallback patterns if not in git repo
             patterns = ['.git/**', '.venv/**', '__pycache__/**', '*.pyc', '.env']
         
-        return list(set(patterns))  # Remove duplicates
+        return list(dict.fromkeys(patterns))  # Remove duplicates, keep order
+    
+    def _read_git_excludes(self) -> list[str]:
+        """Read patterns from core.excludesfile, .git/info/exclude and .gitignore"""
+        local_path = self.config['local_path']
+        result = subprocess.run(
+            ['git', '-C', str(local_path), 'config', '--path', 'core.excludesfile'],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            global_excludes = Path(result.stdout.strip()).expanduser()
+        else:
+            config_home = os.environ.get('XDG_CONFIG_HOME') or Path.home() / '.config'
+            global_excludes = Path(config_home) / 'git' / 'ignore'
+        
+        # Lowest precedence first, so later (more specific) rules win as in git
+        patterns = []
+        for source in (global_excludes, local_path / '.git' / 'info' / 'exclude',
+                       local_path / '.gitignore'):
+            try:
+                lines = source.read_text().splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                # Mark directory entries explicitly so they only match directories
+                if (not line.endswith('/') and not line.startswith('!')
+                        and (local_path / line.lstrip('/')).is_dir()):
+                    line += '/'
+                patterns.append(line)
+        return patterns
+    
+    def _mutagen_cmd(self, *args: str) -> list[str]:
+        """Build a mutagen command line using the binary resolved at startup"""
+        if not self._mutagen_bin:
+            raise click.ClickException("mutagen not found on PATH (see https://mutagen.io)")
+        return [self._mutagen_bin, *args]
     
     def _run_mutagen(self, *args) -> subprocess.CompletedProcess:
         """Run a mutagen command"""
-        cmd = ['mutagen'] + list(args)
-        return subprocess.run(cmd, capture_output=True, text=True)
+        return subprocess.run(self._mutagen_cmd(*args), capture_output=True, text=True,
+                              encoding='utf-8', errors='replace')
     
     def _ssh_test(self) -> bool:
-        """Test SSH connection"""
+        """Test SSH connection, leaving a shared master connection open for reuse
+        
+        Mutagen's own ssh child only reuses that connection if ~/.ssh/config
+        points it at the same socket, e.g.:
+        
+            Host 192.168.1.67
+                ControlMaster auto
+                ControlPath ~/.ssh/cm-%r@%h:%p
+                ControlPersist 10m
+        """
+        if not self._ssh_bin:
+            raise click.ClickException("ssh not found on PATH")
+        
+        # ssh exits 255 if the socket directory is missing, e.g. on a fresh account
+        ssh_dir = Path.home() / '.ssh'
+        try:
+            ssh_dir.mkdir(mode=0o700, exist_ok=True)
+            master_opts = ['-o', 'ControlMaster=auto',
+                           '-o', f'ControlPath={ssh_dir}/cm-%r@%h:%p',
+                           '-o', 'ControlPersist=10m']
+        except OSError as e:
+            logger.debug(f"Not sharing an ssh master connection: {e}")
+            master_opts = []
+        
         result = subprocess.run(
-            ['ssh', '-o', 'ConnectTimeout=5', '-o', 'BatchMode=yes', 
-             self.config['remote_host'], 'echo', 'ok'],
+            [self._ssh_bin, *master_opts,
+             '-o', 'ConnectTimeout=5', '-o', 'BatchMode=yes',
+             self.config['remote_host'], 'true'],
             capture_output=True
         )
         return result.returncode == 0
@@ -249,9 +415,8 @@ class MutagenSync:
         if not self._ssh_test():
             raise click.ClickException(f"Cannot connect to {self.config['remote_host']}")
         
-        # Check if session exists
-        result = self._run_mutagen('sync', 'list')
-        if result.stdout and self.session_name in result.stdout:
+        # Check if session exists; mutagen itself allows duplicate names
+        if self.session_name in self._session_names():
             if not force:
                 click.echo(f"Session {self.session_name} already exists. Use --force to recreate.")
                 return
@@ -259,18 +424,18 @@ class MutagenSync:
                 self.stop()
         
         # Get ignore patterns
-        ignore_args = []
-        for pattern in self._get_ignore_patterns():
-            ignore_args.extend(['--ignore', pattern])
+        ignore_args = list(itertools.chain.from_iterable(
+            ('--ignore', pattern) for pattern in self._get_ignore_patterns()
+        ))
         
         # Create session
-        cmd = [
-            'mutagen', 'sync', 'create',
+        cmd = self._mutagen_cmd(
+            'sync', 'create',
             f'--name={self.session_name}',
             *ignore_args,
             str(self.config['local_path']),
             f"{self.config['remote_host']}:{self.config['remote_path']}"
-        ]
+        )
         
         logger.debug(f"Creating sync with {len(ignore_args)//2} ignore patterns")
         result = subprocess.run(cmd, capture_output=True, text=True)
@@ -281,22 +446,31 @@ class MutagenSync:
         else:
             raise click.ClickException(f"Failed to create sync: {result.stderr}")
     
+    def _session_names(self) -> list[str]:
+        """Names of all sync sessions known to the daemon"""
+        result = self._run_mutagen('sync', 'list', '--template', SESSION_NAMES_TEMPLATE)
+        if result.returncode == 0:
+            return result.stdout.split()
+        
+        # Older mutagen without --template support: parse the human-readable list
+        result = self._run_mutagen('sync', 'list')
+        return [match['name'] for match in _NAME_RE.finditer(result.stdout or '')]
+    
     def stop(self, all_sessions: bool = False):
         """Stop sync session(s)"""
         if all_sessions:
-            # Get all fpga-sync-* sessions by parsing list output
-            result = self._run_mutagen('sync', 'list')
-            if result.stdout:
+            names = self._session_names()
+            if names:
+                # Terminate all fpga-sync-* sessions in one call
+                names = [name for name in names if name.startswith('fpga-sync-')]
                 stopped = []
-                lines = result.stdout.strip().split('\n')
-                
-                for line in lines:
-                    if line.strip().startswith('Name:'):
-                        name = line.split(':', 1)[1].strip()
-                        if name.startswith('fpga-sync-'):
-                            term_result = self._run_mutagen('sync', 'terminate', name)
-                            if term_result.returncode == 0:
-                                stopped.append(name)
+                if names:
+                    if self._run_mutagen('sync', 'terminate', *names).returncode == 0:
+                        stopped = names
+                    else:
+                        # Retry one at a time to find out which sessions could be stopped
+                        stopped = [name for name in names
+                                   if self._run_mutagen('sync', 'terminate', name).returncode == 0]
                 
                 if stopped:
                     click.secho(f"✓ Stopped {len(stopped)} sync session(s): {', '.join(stopped)}", fg='green')
@@ -317,11 +491,94 @@ class MutagenSync:
         time.sleep(1)
         self.start(force)
     
+    def _monitor_stream(self) -> Iterator[dict[str, Session]]:
+        """Yield the session state after each update from a single `mutagen sync monitor`
+        
+        Ends without yielding if the monitor cannot be started or does not
+        produce JSON (older mutagen without --template support).
+        """
+        cmd = self._mutagen_cmd('sync', 'monitor', '--template', MONITOR_TEMPLATE,
+                                self.session_name)
+        try:
+            proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL)
+        except OSError as e:
+            logger.debug(f"Cannot start mutagen sync monitor: {e}")
+            return
+        
+        decoder = json.JSONDecoder()
+        sessions: dict[str, Session] = {}
+        buffer = ''
+        idle_ticks = 0
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(proc.stdout, selectors.EVENT_READ)
+            while True:
+                if not sel.select(monitor_wait(idle_ticks)):
+                    idle_ticks += 1
+                    continue
+                idle_ticks = 0
+                
+                chunk = os.read(proc.stdout.fileno(), 65536)
+                if not chunk:
+                    return
+                buffer += chunk.decode('utf-8', 'replace')
+                
+                updated = False
+                while buffer.lstrip():
+                    buffer = buffer.lstrip()
+                    if buffer[0] not in '{[':
+                        logger.debug("mutagen sync monitor output is not JSON")
+                        return
+                    try:
+                        record, end = decoder.raw_decode(buffer)
+                    except json.JSONDecodeError:
+                        break  # Incomplete document; wait for more output
+                    buffer = buffer[end:]
+                    for item in record if isinstance(record, list) else [record]:
+                        session = session_from_json(item)
+                        sessions[session.name] = session
+                    updated = True
+                
+                if updated:
+                    yield sessions
+        except (OSError, ValueError) as e:
+            logger.debug(f"Stopped reading mutagen sync monitor: {e}")
+        finally:
+            sel.close()
+            proc.terminate()
+            proc.wait()
+            proc.stdout.close()
+    
+    def _watch_with_monitor(self, verbose: bool) -> bool:
+        """Live-render status from the monitor stream; False if the stream is unavailable"""
+        from rich.live import Live
+        
+        with closing(self._monitor_stream()) as stream:
+            sessions = next(stream, None)
+            if sessions is None:
+                return False
+            
+            last_state = repr(sessions)
+            table = create_status_table(list(sessions.values()), verbose=verbose)
+            with Live(table, console=self.console, refresh_per_second=4) as live:
+                for sessions in stream:
+                    # Only repaint when a session actually changed
+                    state = repr(sessions)
+                    if state != last_state:
+                        last_state = state
+                        live.update(create_status_table(list(sessions.values()), verbose=verbose))
+        
+        click.echo("\nSession monitor exited")
+        return True
+    
     def status(self, watch: bool = False, verbose: bool = None):
         """Show sync status"""
         # Use local verbose if provided, otherwise fall back to instance verbose
         use_verbose = verbose if verbose is not None else self.verbose
         
+        from rich.text import Text
+        
         def show():
             result = self._run_mutagen('sync', 'list')
             if result.returncode != 0 or not result.stdout.strip():
@@ -332,7 +589,7 @@ class MutagenSync:
             sessions = parse_sessions(result.stdout)
             
             # Filter fpga-sync sessions
-            fpga_sessions = [s for s in sessions if s.get('name', '').startswith('fpga-sync-')]
+            fpga_sessions = [s for s in sessions if s.name.startswith('fpga-sync-')]
             
             if not fpga_sessions:
                 click.secho("No fpga-sync sessions found", fg='yellow')
@@ -344,16 +601,20 @@ class MutagenSync:
             
             # Show conflicts if any
             for session in fpga_sessions:
-                conflicts = session.get('conflicts', [])
+                conflicts = session.conflicts
                 if conflicts:
-                    self.console.print(f"\n[bold red]⚠ Conflicts in {session['name']}:[/bold red]")
-                    source_path = session.get('source', '')
-                    for conflict in conflicts:
-                        full_path = f"{source_path}/{conflict}" if source_path else conflict
-                        self.console.print(f"  [red]→ {full_path}[/red]")
+                    prefix = f"{session.source}/" if session.source not in ('', 'N/A') else ''
+                    # One print per session; plain Text so '[' in paths is not read as markup
+                    text = Text(f"\n⚠ Conflicts in {session.name}:", style='bold red')
+                    text.append(''.join(f"\n  → {prefix}{conflict}" for conflict in conflicts),
+                                style='red')
+                    self.console.print(text)
         
         if watch:
             try:
+                if self._watch_with_monitor(use_verbose):
+                    return
+                # Fall back to polling `mutagen sync list`
                 while True:
                     click.clear()
                     show()
@@ -429,6 +690,8 @@ def init():
         }
     }
     
+    import yaml
+    
     path = Path('mutagen-sync.yml')
     if path.exists():
         if not click.confirm(f"{path} exists. Overwrite?"):
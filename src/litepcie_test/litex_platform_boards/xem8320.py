@@ -1,3 +1,5 @@
+from functools import cache, lru_cache
+
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxUSPPlatform, VivadoProgrammer
 from litex.build.openfpgaloader import OpenFPGALoader
@@ -6,18 +8,31 @@ from litex.soc.cores.clock import USPMMCM, USPIDELAYCTRL
 from litex.gen import LiteXModule
 from migen.genlib.resetsync import AsyncResetSynchronizer
 
+# Constraint flyweights ----------------------------------------------------------------------------
+
+# Identical IOStandard/Misc settings share one object across all the IO tables
+@cache
+def _IOSTD(name):
+    return IOStandard(name)
+
+
+@cache
+def _MISC(misc):
+    return Misc(misc)
+
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
     # Clk / Rst
     ("clkin100", 0,
-     Subsignal("p", Pins("T24"), IOStandard("LVDS")),
-     Subsignal("n", Pins("U24"), IOStandard("LVDS"))
+     Subsignal("p", Pins("T24"), _IOSTD("LVDS")),
+     Subsignal("n", Pins("U24"), _IOSTD("LVDS"))
      ),
 
     ("clkin100_ddr", 0,  # this clk is close to DDR4
-     Subsignal("p", Pins("AD20"), IOStandard("LVDS")),
-     Subsignal("n", Pins("AE20"), IOStandard("LVDS"))
+     Subsignal("p", Pins("AD20"), _IOSTD("LVDS")),
+     Subsignal("n", Pins("AE20"), _IOSTD("LVDS"))
      ),
 
     ("clkin156_25", 0,  # this clk is close to DDR4
@@ -30,12 +45,12 @@ _io = [
     # ("cpu_reset", 0, Pins("AN8"), IOStandard("LVCMOS18")),
 
     # Leds
-    ("user_led", 0, Pins("G19"), IOStandard("LVCMOS12")),
-    ("user_led", 1, Pins("B16"), IOStandard("LVCMOS12")),
-    ("user_led", 2, Pins("F22"), IOStandard("LVCMOS12")),
-    ("user_led", 3, Pins("E22"), IOStandard("LVCMOS12")),
-    ("user_led", 4, Pins("M24"), IOStandard("LVCMOS12")),
-    ("user_led", 5, Pins("G22"), IOStandard("LVCMOS12")),
+    ("user_led", 0, Pins("G19"), _IOSTD("LVCMOS12")),
+    ("user_led", 1, Pins("B16"), _IOSTD("LVCMOS12")),
+    ("user_led", 2, Pins("F22"), _IOSTD("LVCMOS12")),
+    ("user_led", 3, Pins("E22"), _IOSTD("LVCMOS12")),
+    ("user_led", 4, Pins("M24"), _IOSTD("LVCMOS12")),
+    ("user_led", 5, Pins("G22"), _IOSTD("LVCMOS12")),
 
     # Opal Kelly Host USBC interface
     ("okHost", 0,  # Uses the FrontPanel API
@@ -47,8 +62,8 @@ _io = [
          "R21 R20 P23 N23 T25 N24 N22 V26",
          "N19 V21 N21 W20 W26 W19 Y25 Y26",
          "Y22 V22 W21 AA23 Y23 AA24 W25 AA25")),
-     IOStandard("LVCMOS18"),
-     Misc("SLEW=FAST"),
+     _IOSTD("LVCMOS18"),
+     _MISC("SLEW=FAST"),
      ),
 
     # TODO: Add SMA & SFP+
@@ -58,39 +73,39 @@ _io = [
      Subsignal("a", Pins(
          "AD18 AE17 AB17 AE18 AD19 AF17 Y17 AE16",
          "AA17 AC17 AC19 AC16 AF20 AD16"),
-               IOStandard("SSTL12_DCI")),
-     Subsignal("ba", Pins("AC18 AF18"), IOStandard("SSTL12_DCI")),
-     Subsignal("bg", Pins("AB19"), IOStandard("SSTL12_DCI")),
+               _IOSTD("SSTL12_DCI")),
+     Subsignal("ba", Pins("AC18 AF18"), _IOSTD("SSTL12_DCI")),
+     Subsignal("bg", Pins("AB19"), _IOSTD("SSTL12_DCI")),
 
-     Subsignal("ras_n", Pins("AA18"), IOStandard("SSTL12_DCI")),
-     Subsignal("cas_n", Pins("AF19"), IOStandard("SSTL12_DCI")),
-     Subsignal("we_n", Pins("AA19"), IOStandard("SSTL12_DCI")),
+     Subsignal("ras_n", Pins("AA18"), _IOSTD("SSTL12_DCI")),
+     Subsignal("cas_n", Pins("AF19"), _IOSTD("SSTL12_DCI")),
+     Subsignal("we_n", Pins("AA19"), _IOSTD("SSTL12_DCI")),
 
-     Subsignal("cs_n", Pins("AF22"), IOStandard("SSTL12_DCI")),
+     Subsignal("cs_n", Pins("AF22"), _IOSTD("SSTL12_DCI")),
 
-     Subsignal("act_n", Pins("Y18"), IOStandard("SSTL12_DCI")),
+     Subsignal("act_n", Pins("Y18"), _IOSTD("SSTL12_DCI")),
      Subsignal("dm", Pins("AE25 AE22"),
-               IOStandard("POD12_DCI")),
+               _IOSTD("POD12_DCI")),
      Subsignal("dq", Pins(
          "AF24 AB25 AB26 AC24 AF25 AB24 AD24 AD25",
          "AB21 AE21 AE23 AD23 AC23 AD21 AC22 AC21"),
-               IOStandard("POD12_DCI"),
-               Misc("PRE_EMPHASIS=RDRV_240"),
-               Misc("EQUALIZATION=EQ_LEVEL2")),
+               _IOSTD("POD12_DCI"),
+               _MISC("PRE_EMPHASIS=RDRV_240"),
+               _MISC("EQUALIZATION=EQ_LEVEL2")),
      Subsignal("dqs_p", Pins("AC26 AA22"),
-               IOStandard("DIFF_POD12_DCI"),
-               Misc("PRE_EMPHASIS=RDRV_240"),
-               Misc("EQUALIZATION=EQ_LEVEL2")),
+               _IOSTD("DIFF_POD12_DCI"),
+               _MISC("PRE_EMPHASIS=RDRV_240"),
+               _MISC("EQUALIZATION=EQ_LEVEL2")),
      Subsignal("dqs_n", Pins("AD26 AB22"),
-               IOStandard("DIFF_POD12_DCI"),
-               Misc("PRE_EMPHASIS=RDRV_240"),
-               Misc("EQUALIZATION=EQ_LEVEL2")),
-     Subsignal("clk_p", Pins("Y20"), IOStandard("DIFF_SSTL12_DCI")),
-     Subsignal("clk_n", Pins("Y21"), IOStandard("DIFF_SSTL12_DCI")),
-     Subsignal("cke", Pins("AA20"), IOStandard("SSTL12_DCI")),
-     Subsignal("odt", Pins("AB20"), IOStandard("SSTL12_DCI")),
-     Subsignal("reset_n", Pins("AE26"), IOStandard("LVCMOS12")),
-     Misc("SLEW=FAST"),
+               _IOSTD("DIFF_POD12_DCI"),
+               _MISC("PRE_EMPHASIS=RDRV_240"),
+               _MISC("EQUALIZATION=EQ_LEVEL2")),
+     Subsignal("clk_p", Pins("Y20"), _IOSTD("DIFF_SSTL12_DCI")),
+     Subsignal("clk_n", Pins("Y21"), _IOSTD("DIFF_SSTL12_DCI")),
+     Subsignal("cke", Pins("AA20"), _IOSTD("SSTL12_DCI")),
+     Subsignal("odt", Pins("AB20"), _IOSTD("SSTL12_DCI")),
+     Subsignal("reset_n", Pins("AE26"), _IOSTD("LVCMOS12")),
+     _MISC("SLEW=FAST"),
      ),
 
     # SFP
@@ -108,7 +123,7 @@ _io = [
     #  Subsignal("p", Pins("M2")),
     #  Subsignal("n", Pins("M1")),
     #  ),
-    ("sfp_tx_disable_n", 0, Pins("C13"), IOStandard("LVCMOS33")),
+    ("sfp_tx_disable_n", 0, Pins("C13"), _IOSTD("LVCMOS33")),
 
     ("sfp", 1,
      Subsignal("txp", Pins("L5")),
@@ -119,13 +134,13 @@ _io = [
 
     ("timestampCaptureInputs", 0,
      Pins("L18 M25 K18 M26 M20 L24 M21 L25"),
-     IOStandard("LVCMOS12"),
-     Misc("SLEW=SLOW"),
-     Misc("PULLTYPE PULLDOWN"),
+     _IOSTD("LVCMOS12"),
+     _MISC("SLEW=SLOW"),
+     _MISC("PULLTYPE PULLDOWN"),
      ),
 
     ("pcie_x4", 0,
-     Subsignal("rst_n", Pins("J10"), IOStandard("LVCMOS18")),
+     Subsignal("rst_n", Pins("J10"), _IOSTD("LVCMOS18")),
      Subsignal("clk_p", Pins("AB7")),
      Subsignal("clk_n", Pins("AB6")),
      Subsignal("rx_p", Pins("AF2 AE4 AD2 AB2")),
@@ -134,7 +149,7 @@ _io = [
      Subsignal("tx_n", Pins("AF6 AE8 AD6 AC4"))
      ),
     ("pcie_x2", 0,
-     Subsignal("rst_n", Pins("J10"), IOStandard("LVCMOS18")),
+     Subsignal("rst_n", Pins("J10"), _IOSTD("LVCMOS18")),
      Subsignal("clk_p", Pins("AB7")),
      Subsignal("clk_n", Pins("AB6")),
      Subsignal("rx_p", Pins("AF2 AE4")),
@@ -166,6 +181,14 @@ _connectors = [
 
 ]
 
+
+@lru_cache(maxsize=1)
+def _build_io_connectors():
+    """IOs and connectors with each connector's pin string split once, shared by all Platforms."""
+    connectors = [(name, dict(enumerate(pins.split()))) for name, pins in _connectors]
+    return tuple(_io), tuple(connectors)
+
+
 # portB connects to Asgard
 portB_breakout = [
 
@@ -174,7 +197,7 @@ portB_breakout = [
      Subsignal("mosi", Pins("portB:18")),
      Subsignal("miso", Pins("portB:16")),
      Subsignal("cs_n", Pins("portB:14")),
-     IOStandard("LVCMOS12")
+     _IOSTD("LVCMOS12")
      ),
 
     # GPIO0 mapping follows table 1 page 8
@@ -191,8 +214,8 @@ portB_breakout = [
          "portB:0 portB:1 portB:2 portB:3 portB:4 portB:5 portB:6 portB:7 portB:8 portB:9 portB:10 "
          # "portB:12 portB:24 portB:20 portB:19 portB:21 portB:23 portB:25 portB:27 portB:11 portB:13"),
          "portB:12 portB:24 portB:20 portB:23 portB:25 portB:27 portB:11 portB:13"),
-     IOStandard("LVCMOS12"),
-     Misc("SLEW SLOW"), Misc("DRIVE 8"),
+     _IOSTD("LVCMOS12"),
+     _MISC("SLEW SLOW"), _MISC("DRIVE 8"),
      # Misc("PULLTYPE PULLDOWN"),
      ),
 
@@ -205,7 +228,7 @@ portB_breakout = [
      Subsignal("data", Pins("portB:26")),
      #  Subsignal("data", Pins("portB:24")),
      # Subsignal("data", Pins("portB:30")),
-     IOStandard("LVCMOS12"), Misc("DRIVE 8"), Misc("PULLTYPE PULLDOWN"), Misc("SLEW FAST"),
+     _IOSTD("LVCMOS12"), _MISC("DRIVE 8"), _MISC("PULLTYPE PULLDOWN"), _MISC("SLEW FAST"),
      ),
 
     # not using for now
@@ -221,24 +244,24 @@ portB_breakout = [
     ("pdm", 0,
      Subsignal("clk", Pins("portB:29")),
      Subsignal("data", Pins("portB:31")),
-     IOStandard("LVCMOS12"),
-     Misc("SLEW=FAST"),
+     _IOSTD("LVCMOS12"),
+     _MISC("SLEW=FAST"),
      ),
 
     ("serial", 0,
      Subsignal("tx", Pins("portB:15")),
      Subsignal("rx", Pins("portB:17")),
-     IOStandard("LVCMOS12"),
-     Misc("SLEW=FAST"),
-     Misc("PULLTYPE PULLUP"),
+     _IOSTD("LVCMOS12"),
+     _MISC("SLEW=FAST"),
+     _MISC("PULLTYPE PULLUP"),
      ),
 
     ("serial", 1,
      Subsignal("tx", Pins("portB:19")),
      Subsignal("rx", Pins("portB:21")),
-     IOStandard("LVCMOS12"),
-     Misc("SLEW=FAST"),
-     Misc("PULLTYPE PULLUP"),
+     _IOSTD("LVCMOS12"),
+     _MISC("SLEW=FAST"),
+     _MISC("PULLTYPE PULLUP"),
      ),
 
 ]
@@ -247,7 +270,7 @@ portB_breakout_drop1_5 = [
     ("spmi", 0,
      Subsignal("clk", Pins("portB:28")),
      Subsignal("data", Pins("portB:30")),
-     IOStandard("LVCMOS12"), Misc("DRIVE 8"), Misc("PULLTYPE PULLDOWN"), Misc("SLEW FAST"),
+     _IOSTD("LVCMOS12"), _MISC("DRIVE 8"), _MISC("PULLTYPE PULLDOWN"), _MISC("SLEW FAST"),
      ),
 
     ("dbg_spi", 0,
@@ -255,14 +278,14 @@ portB_breakout_drop1_5 = [
      Subsignal("mosi", Pins("portB:18")),
      Subsignal("miso", Pins("portB:16")),
      Subsignal("cs_n", Pins("portB:24")),
-     IOStandard("LVCMOS12")
+     _IOSTD("LVCMOS12")
      ),
 
     ("gpio", 0,
      Pins(
          "portB:0 portB:1 portB:2 portB:3 portB:4 portB:5 portB:6 portB:7 portB:8 portB:9 portB:10 portB:11 portB:12 "),
-     IOStandard("LVCMOS12"),
-     Misc("SLEW SLOW"), Misc("DRIVE 8"),
+     _IOSTD("LVCMOS12"),
+     _MISC("SLEW SLOW"), _MISC("DRIVE 8"),
      # Misc("PULLTYPE PULLDOWN"),
      ),
 ]
@@ -271,7 +294,7 @@ portB_breakout_drop1_5 = [
 portD_usb_breakout = [
     ('dbg_io', 0,
      Pins('portC:17 portC:19  portC:6  portC:22  portC:18  portC:16  portC:10 portC:21'),
-     IOStandard("LVCMOS12"),),
+     _IOSTD("LVCMOS12"),),
 
     # portD usb breakout board with 1->4 usb 2.0
     # using only one pullup pin for all 4 USB ports to save FPGA IO
@@ -280,8 +303,8 @@ portD_usb_breakout = [
      Subsignal("d_p", Pins("portD:0")),
      Subsignal("d_n", Pins("portD:2")),
      Subsignal("pullup", Pins("portD:1")),
-     IOStandard("LVCMOS33"),
-     Misc("SLEW=FAST"),
+     _IOSTD("LVCMOS33"),
+     _MISC("SLEW=FAST"),
      # Misc("PULLTYPE PULLDOWN"),
      # Misc("DRIVE 8"),
      ),
@@ -322,22 +345,22 @@ portD_usb_breakout = [
      Subsignal("nxt", Pins("portD:12")),
      Subsignal("stp", Pins("portD:10")),
      Subsignal("rst", Pins("portD:26")),
-     IOStandard("LVCMOS33"), Misc("SLEW=FAST")
+     _IOSTD("LVCMOS33"), _MISC("SLEW=FAST")
      ),
 
     ("pdm", 1,
      Subsignal("clk", Pins("portD:4")),
      Subsignal("data", Pins("portD:6")),
      Subsignal("sel", Pins("portD:8")),
-     IOStandard("LVCMOS33"),
-     Misc("SLEW=FAST"),
-     Misc("PULLTYPE PULLUP"),
+     _IOSTD("LVCMOS33"),
+     _MISC("SLEW=FAST"),
+     _MISC("PULLTYPE PULLUP"),
      ),
 ]
 
 portF_pcie_breakout = [
     ("pcie_x4", 0,
-     Subsignal("rst_n", Pins("portF:12"), IOStandard("LVCMOS18")),
+     Subsignal("rst_n", Pins("portF:12"), _IOSTD("LVCMOS18")),
      Subsignal("clk_p", Pins("portF:8")),
      Subsignal("clk_n", Pins("portF:10")),
      Subsignal("rx_p", Pins("portF:0 portF:4 portF:24 portF:20")),
@@ -349,7 +372,7 @@ portF_pcie_breakout = [
 
 portE_pcie_breakout = [
     ("pcie_x4", 0,
-     Subsignal("rst_n", Pins("portE:12"), IOStandard("LVCMOS18")),
+     Subsignal("rst_n", Pins("portE:12"), _IOSTD("LVCMOS18")),
      Subsignal("clk_p", Pins("portE:8")),
      Subsignal("clk_n", Pins("portE:10")),
      Subsignal("rx_p", Pins("portE:0 portE:4 portE:24 portE:20")),
@@ -443,17 +466,24 @@ class Platform(XilinxUSPPlatform):
     hw_platform = "xem8320"
 
     def __init__(self, toolchain="vivado"):
-        XilinxUSPPlatform.__init__(self, "xcau25p-ffvb676-2-e", _io, _connectors,
+        io, connectors = _build_io_connectors()
+        XilinxUSPPlatform.__init__(self, "xcau25p-ffvb676-2-e", io, connectors,
                                    toolchain=toolchain)
         self.sys_clk_freq = None
         self.crg = None
+        self._lookup_cache = {}
         # USB serial consol cp2104 friend in portA
         # self.platform.add_extension(xem8320_platform.portA_usb_serial_breakout)
+        # Breakout boards are registered on demand: add_usb_breakout() / add_pcie_breakout()
+        self.enable_ok_frontpanel_clk = False
+
+    def add_usb_breakout(self):
         # USB debug breakout board in portD
         self.add_extension(portD_usb_breakout)
 
+    def add_pcie_breakout(self):
+        # PCIe breakout board in portE
         self.add_extension(portE_pcie_breakout)
-        self.enable_ok_frontpanel_clk = False
 
     def get_default_crg(self, sys_clk_freq=150e6, clk_in_ios="clkin100", clk_in_freq=100e6,
                         margin=1e-2):
@@ -462,34 +492,34 @@ class Platform(XilinxUSPPlatform):
                         sys_clk_freq=sys_clk_freq,
                         # timestamp_freq=
                         margin=margin)
-        # Ignore sys_clk to pll.clkin path created by SoC's rst.
-        self.add_false_path_constraints(self.crg.cd_sys.clk,
-                                        self.crg.pll.clkin)
-        self.add_false_path_constraints(self.crg.cd_spmi24Mhz.clk,
-                                        self.crg.pll.clkin)
-        self.add_false_path_constraints(self.crg.cd_sys.clk,
-                                        self.crg.cd_spmi24Mhz.clk)
-
-        self.add_false_path_constraints(self.crg.cd_spmi16Mhz.clk,
-                                        self.crg.pll.clkin)
-        self.add_false_path_constraints(self.crg.cd_sys.clk,
-                                        self.crg.cd_spmi16Mhz.clk)
-
-        self.add_false_path_constraints(self.crg.cd_sys.clk,
-                                        self.crg.cd_pll48Mhz.clk)
-
-        self.add_false_path_constraints(self.crg.cd_sys.clk,
-                                        self.crg.cd_usb_48.clk)
-        self.add_false_path_constraints(self.crg.cd_sys.clk,
-                                        self.crg.cd_usb_12.clk)
-        # self.add_false_path_constraints(self.crg.cd_sys.clk,
-        #                                 self.crg.cd_eth.clk)
-        # self.add_false_path_constraints(self.crg.cd_sys.clk,
-        #                                 self.crg.cd_usb_60.clk)
+        crg = self.crg
+        # Asynchronous clock pairs
+        false_paths = [
+            # Ignore sys_clk to pll.clkin path created by SoC's rst.
+            (crg.cd_sys.clk, crg.pll.clkin),
+            (crg.cd_spmi24Mhz.clk, crg.pll.clkin),
+            (crg.cd_sys.clk, crg.cd_spmi24Mhz.clk),
+            (crg.cd_spmi16Mhz.clk, crg.pll.clkin),
+            (crg.cd_sys.clk, crg.cd_spmi16Mhz.clk),
+            (crg.cd_sys.clk, crg.cd_pll48Mhz.clk),
+            (crg.cd_sys.clk, crg.cd_usb_48.clk),
+            (crg.cd_sys.clk, crg.cd_usb_12.clk),
+            # (crg.cd_sys.clk, crg.cd_eth.clk),
+            # (crg.cd_sys.clk, crg.cd_usb_60.clk),
+        ]
+        for from_, to in false_paths:
+            self.add_false_path_constraint(from_, to)
 
         self.sys_clk_freq = self.crg.sys_clk_freq
         return self.crg
 
+    def _cached_lookup(self, name, idx=0):
+        # Remember loose lookups (including misses) so re-finalizing doesn't rescan the IOs
+        key = (name, idx)
+        if key not in self._lookup_cache:
+            self._lookup_cache[key] = self.lookup_request(name, idx, loose=True)
+        return self._lookup_cache[key]
+
     def create_programmer(self, ftdi_serial=None):
         return OpenFPGALoader(fpga_part="xcau25p-ffvb676", cable="ft232", freq=15_000_000,
                               ftdi_serial=ftdi_serial)
@@ -511,11 +541,14 @@ class Platform(XilinxUSPPlatform):
         # DDR4 memory channel C0 Clock constraint / Internal Vref
         self.add_platform_command("set_property INTERNAL_VREF 0.84 [get_iobanks 64]")
 
-        self.add_period_constraint(self.lookup_request("clkin100", 0, loose=True), 1e9 / 100e6)
-        self.add_period_constraint(self.lookup_request("clkin100_ddr", 0, loose=True), 1e9 / 100e6)
-        self.add_period_constraint(self.lookup_request("clkin125", 0, loose=True), 1e9 / 100e6)
-        self.add_period_constraint(self.lookup_request("clkin156_25", 0, loose=True),
-                                   1e9 / 156.25e6)
+        # Board input clocks: (IO name, period in ns)
+        input_clocks = [
+            ("clkin100", 1e9 / 100e6),
+            ("clkin100_ddr", 1e9 / 100e6),
+            ("clkin156_25", 1e9 / 156.25e6),
+        ]
+        for clk_name, period in input_clocks:
+            self.add_period_constraint(self._cached_lookup(clk_name), period)
 
         # # spmi clock pin
         # self.add_period_constraint(clk=self.crg.cd_spmi_clk_pin.clk, period=41.667)
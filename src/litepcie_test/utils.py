@@ -6,16 +6,57 @@ import cProfile
 import timeit
 import pstats
 import io
+import os
 import sys
-from typing import Callable, Any, Optional
+from typing import Callable, Any
 
 from loguru import logger
 
+# The package logger is disabled by default, so measure_time also prints to
+# stdout unless LITEPCIE_TEST_PRINT_TIMING=0
+_PRINT_TIMING = os.environ.get("LITEPCIE_TEST_PRINT_TIMING", "1") != "0"
+
+
+def _split_centis(elapsed_ns: int) -> tuple[int, int]:
+    """Round a duration in nanoseconds to centiseconds; return (seconds, centiseconds)."""
+    return divmod((elapsed_ns + 5_000_000) // 10_000_000, 100)
+
+
+def _format_seconds(elapsed_ns: int) -> str:
+    """Format a duration in nanoseconds as seconds with two decimals, e.g. '3.45'."""
+    seconds, centis = _split_centis(elapsed_ns)
+    return f"{seconds}.{centis:02d}"
+
+
+def _format_elapsed(elapsed_ns: int) -> str:
+    """Format a duration in nanoseconds as e.g. '1h 2m 3.45s'."""
+    seconds, centis = _split_centis(elapsed_ns)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    time_units = []
+    if hours > 0:
+        time_units.append(f"{hours}h")
+    if minutes > 0:
+        time_units.append(f"{minutes}m")
+    time_units.append(f"{seconds}.{centis:02d}s")
+    return " ".join(time_units)
+
+
+def _log_elapsed(func: Callable, elapsed_ns: int) -> None:
+    """Report a measured call; the log record points at the calling wrapper."""
+    if _PRINT_TIMING:
+        print(f"{func.__name__} - Elapsed time: {_format_elapsed(elapsed_ns)}")
+    # Lazy so the message is only formatted when INFO is enabled
+    logger.opt(lazy=True, depth=1).info(
+        "{} - Elapsed time: {}", lambda: func.__name__, lambda: _format_elapsed(elapsed_ns)
+    )
+
 
 def measure_time(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
         except Exception as e:
@@ -23,57 +64,60 @@ def measure_time(func):
             print(e)
             result = None
 
-        end_time = time.perf_counter()
+        _log_elapsed(func, time.perf_counter_ns() - start_ns)
 
-        elapsed_time = end_time - start_time
-        hours, remainder = divmod(elapsed_time, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        return result
 
-        time_units = []
-        if hours > 0:
-            time_units.append(f"{int(hours)}h")
-        if minutes > 0:
-            time_units.append(f"{int(minutes)}m")
-        time_units.append(f"{seconds:.2f}s")
+    return wrapper
 
-        elapsed_time_str = " ".join(time_units)
-        print(f"{func.__name__} - Elapsed time: {elapsed_time_str}")
-        try:
-            logger.info(f"{func.__name__} - Elapsed time: {elapsed_time_str}")
-        except Exception as e:
-            print(f"Logger error: {e}")
 
-        return result
+def measure_time_fast(func):
+    """Positional-only variant of measure_time for hot paths.
+
+    Skips the **kwargs packing on every call, so it cannot wrap functions that
+    take keyword arguments. Unlike measure_time, exceptions propagate.
+    """
+    @wraps(func)
+    def wrapper(*args):
+        start_ns = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            _log_elapsed(func, time.perf_counter_ns() - start_ns)
 
     return wrapper
 
 
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+def _install_handler(log: logging.Logger) -> None:
+    """Attach a stderr handler using the shared formatter."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(_FORMATTER)
+    log.addHandler(handler)
+
+
 def measure_time_new(func):
     """Decorator to measure the execution time of a function using standard logging."""
+    # Use a dedicated logger for this decorator, set up once per decorated function
+    decorator_logger = logging.getLogger(f"measure_time.{func.__module__}.{func.__name__}")
+    decorator_logger.setLevel(logging.INFO)
+    if not decorator_logger.handlers:
+        _install_handler(decorator_logger)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Use a dedicated logger for this decorator
-        decorator_logger = logging.getLogger(f"measure_time.{func.__module__}.{func.__name__}")
-        decorator_logger.setLevel(logging.INFO)
-
-        # Add a handler if one doesn't exist for this logger
-        if not decorator_logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            decorator_logger.addHandler(handler)
-
         decorator_logger.info(f"Starting execution of {func.__name__}")
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            elapsed = time.perf_counter() - start_time
-            decorator_logger.info(f"{func.__name__} completed in {elapsed:.2f} seconds")
+            elapsed = _format_seconds(time.perf_counter_ns() - start_ns)
+            decorator_logger.info(f"{func.__name__} completed in {elapsed} seconds")
             return result
         except Exception as e:
-            elapsed = time.perf_counter() - start_time
-            decorator_logger.error(f"{func.__name__} failed after {elapsed:.2f} seconds: {e}")
+            elapsed = _format_seconds(time.perf_counter_ns() - start_ns)
+            decorator_logger.error(f"{func.__name__} failed after {elapsed} seconds: {e}")
             raise
 
     return wrapper
@@ -83,28 +127,37 @@ def measure_time_new(func):
 def timer(name: str = "Operation"):
     """Context manager for timing code blocks."""
     logger.info(f"Starting {name}")
-    start = time.perf_counter()
+    start_ns = time.perf_counter_ns()
     try:
         yield
-        elapsed = time.perf_counter() - start
-        logger.success(f"{name} completed in {elapsed:.2f}s")
+        elapsed = _format_seconds(time.perf_counter_ns() - start_ns)
+        logger.success(f"{name} completed in {elapsed}s")
     except Exception as e:
-        elapsed = time.perf_counter() - start
-        logger.error(f"{name} failed after {elapsed:.2f}s: {e}")
+        elapsed = _format_seconds(time.perf_counter_ns() - start_ns)
+        logger.error(f"{name} failed after {elapsed}s: {e}")
         raise
 
 
-# 8. Context manager for profiling code blocks
 @contextmanager
-def profiler(name: str = "Code block", sort_by: str = 'cumulative',
-             print_stats: Optional[int] = 30):
-    """
-    Context manager for profiling code blocks with cProfile.
+def _sampling_profile(name: str, prof):
+    logger.info(f"Starting profile: {name}")
 
-    Usage:
-        with profiler("My operation"):
-            # code to profile
-    """
+    prof.start()
+    try:
+        yield prof
+        prof.stop()
+
+        logger.info(f"\nProfile results for {name}:")
+        print(prof.output_text(unicode=True, color=False))
+
+    except Exception as e:
+        prof.stop()
+        logger.error(f"Error during profiling {name}: {e}")
+        raise
+
+
+@contextmanager
+def _cprofile_profile(name: str, sort_by: str, print_stats: int | None):
     prof = cProfile.Profile()
     logger.info(f"Starting profile: {name}")
 
@@ -125,3 +178,40 @@ def profiler(name: str = "Code block", sort_by: str = 'cumulative',
         prof.disable()
         logger.error(f"Error during profiling {name}: {e}")
         raise
+
+
+# 8. Context manager for profiling code blocks
+@contextmanager
+def profiler(name: str = "Code block", sort_by: str = 'cumulative',
+             print_stats: int | None = 30, backend: str = "cprofile",
+             interval_us: int = 1000):
+    """
+    Context manager for profiling code blocks.
+
+    The default "cprofile" backend yields a cProfile.Profile and prints the
+    top print_stats entries sorted by sort_by. backend="sampling" uses
+    pyinstrument (the "profiling" extra), which slows the profiled code far
+    less, yields a pyinstrument Profiler and ignores sort_by/print_stats; it
+    falls back to cProfile when pyinstrument is not installed.
+
+    Usage:
+        with profiler("My operation"):
+            # code to profile
+    """
+    if backend == "sampling":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument is not installed (litepcie-test[profiling]), "
+                           "falling back to cProfile")
+            backend = "cprofile"
+
+    if backend == "sampling":
+        ctx = _sampling_profile(name, Profiler(interval=interval_us * 1e-6))
+    elif backend == "cprofile":
+        ctx = _cprofile_profile(name, sort_by, print_stats)
+    else:
+        raise ValueError(f"Unknown profiler backend: {backend!r}")
+
+    with ctx as prof:
+        yield prof
@@ -0,0 +1,71 @@
+"""Tests for the ignore-file parsing in scripts/mutagen_sync.py."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "mutagen_sync.py"
+_spec = importlib.util.spec_from_file_location("mutagen_sync", _SCRIPT)
+mutagen_sync = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mutagen_sync)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", []),
+        ("\n\n", []),
+        ("   \n\t\n", []),
+        ("# comment\n", []),
+        ("   # indented comment\n", []),
+        ("build/\n", ["build/"]),
+        ("  *.log  \n", ["*.log"]),
+        ("\tdist/\t# trailing comment\n", ["dist/"]),
+        ("foo#bar\n", ["foo"]),
+        ("no-newline-at-eof", ["no-newline-at-eof"]),
+        ("crlf/\r\n*.o\r\n", ["crlf/", "*.o"]),
+        ("!keep.log\n", ["!keep.log"]),
+        ("*.log\n!important.log\n", ["*.log", "!important.log"]),
+        ("# header\n\nbuild/\n  # note\n/out\n\n", ["build/", "/out"]),
+    ],
+)
+def test_read_patterns_mutagenignore(tmp_path, text, expected):
+    """.mutagenignore lines are stripped of comments and whitespace, with no defaults."""
+    (tmp_path / ".mutagenignore").write_text(text)
+    parser = mutagen_sync.GitignoreParser(tmp_path)
+
+    assert parser.read_patterns() == expected
+
+
+def test_read_patterns_gitignore_adds_defaults(tmp_path):
+    """.gitignore patterns follow the built-in defaults."""
+    (tmp_path / ".gitignore").write_text("# comment\nbuild/\n\n!keep\n")
+    parser = mutagen_sync.GitignoreParser(tmp_path)
+
+    assert parser.read_patterns() == [*mutagen_sync.GitignoreParser.DEFAULT_PATTERNS,
+                                      "build/", "!keep"]
+
+
+def test_read_patterns_without_ignore_files(tmp_path):
+    """Without any ignore file only the defaults are returned."""
+    parser = mutagen_sync.GitignoreParser(tmp_path)
+
+    assert parser.read_patterns() == list(mutagen_sync.GitignoreParser.DEFAULT_PATTERNS)
+
+
+@pytest.mark.parametrize(
+    ("direction", "expected"),
+    [
+        (mutagen_sync.SyncDirection.PUSH,
+         ["--ignore", "build/**", "--ignore", "root.txt", "--ignore", "*.log"]),
+        (mutagen_sync.SyncDirection.PULL,
+         ["--ignore", "root.txt", "--ignore", "*.log"]),
+    ],
+)
+def test_convert_to_mutagen_patterns(direction, expected):
+    """Negations and kept binaries are dropped; dirs and anchored paths are normalized."""
+    parser = mutagen_sync.GitignoreParser(Path("."))
+    patterns = ["build/", "!keep.log", "/root.txt", "*.bit", "*.log"]
+
+    assert parser.convert_to_mutagen_patterns(patterns, direction) == expected
@@ -0,0 +1,87 @@
+"""Tests for the `mutagen sync list` parser in scripts/mutagen_sync_v2.py."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "mutagen_sync_v2.py"
+_spec = importlib.util.spec_from_file_location("mutagen_sync_v2", _SCRIPT)
+mutagen_sync_v2 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mutagen_sync_v2)
+
+Session = mutagen_sync_v2.Session
+
+_SEP = "-" * 80
+
+_WATCHING = f"""{_SEP}
+Name: fpga-sync-default
+Identifier: sync_abc123
+Labels: None
+Alpha:
+\tURL: /home/me/proj
+\tConnected: Yes
+\tSynchronizable contents:
+\t\t12 directories
+\t\t345 files (1.2 MB)
+\t\t0 symbolic links
+Beta:
+\tURL: fpga@192.168.1.67:~/proj
+\tConnected: Yes
+\tSynchronizable contents:
+\t\t12 directories
+\t\t345 files (1.2 MB)
+\t\t0 symbolic links
+Status: Watching for changes
+{_SEP}
+"""
+
+_CONFLICTED = f"""{_SEP}
+Name: fpga-sync-pull
+Alpha:
+\tURL: fpga@192.168.1.67:~/proj/build
+Beta:
+\tURL: /home/me/proj/build
+Conflicts:
+\t(alpha) gateware/top.v (File)
+\t- software/main.c
+Status: Watching for changes
+{_SEP}
+"""
+
+_WATCHING_SESSION = Session(
+    name="fpga-sync-default",
+    status="Watching for changes",
+    source="/home/me/proj",
+    target="fpga@192.168.1.67:~/proj",
+    file_info="345 files (1.2 MB)",
+)
+
+_CONFLICTED_SESSION = Session(
+    name="fpga-sync-pull",
+    status="Watching for changes",
+    source="fpga@192.168.1.67:~/proj/build",
+    target="/home/me/proj/build",
+    conflicts=("(alpha) gateware/top.v (File)", "software/main.c"),
+)
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ("", []),
+        (f"{_SEP}\n", []),
+        ("No synchronization sessions found\n", []),
+        (_WATCHING, [_WATCHING_SESSION]),
+        (_CONFLICTED, [_CONFLICTED_SESSION]),
+        (_WATCHING + _CONFLICTED, [_WATCHING_SESSION, _CONFLICTED_SESSION]),
+        # Text before the first Name: line belongs to no session; the old
+        # line-by-line parser turned the Status: line here into a nameless one
+        ('Started Mutagen daemon in background\nStatus: Connecting\n' + _WATCHING,
+         [_WATCHING_SESSION]),
+        ("Name:   padded   \n", [Session(name="padded")]),
+    ],
+)
+def test_parse_sessions(output, expected):
+    """Each Name: line starts a session; missing fields keep their defaults."""
+    assert mutagen_sync_v2.parse_sessions(output) == expected
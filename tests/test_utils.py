@@ -0,0 +1,45 @@
+"""Tests for the elapsed-time formatting in litepcie_test.utils."""
+
+import pytest
+
+from litepcie_test.utils import _format_elapsed, _format_seconds
+
+_S = 1_000_000_000
+_MS = 1_000_000
+
+
+@pytest.mark.parametrize(
+    ("elapsed_ns", "expected"),
+    [
+        (0, "0.00"),
+        (4 * _MS, "0.00"),
+        (5 * _MS, "0.01"),
+        (994 * _MS, "0.99"),
+        (996 * _MS, "1.00"),
+        (3 * _S + 454_999_999, "3.45"),
+        (59_996 * _MS, "60.00"),
+        (3600 * _S, "3600.00"),
+    ],
+)
+def test_format_seconds(elapsed_ns, expected):
+    """Durations round to the nearest centisecond."""
+    assert _format_seconds(elapsed_ns) == expected
+
+
+@pytest.mark.parametrize(
+    ("elapsed_ns", "expected"),
+    [
+        (0, "0.00s"),
+        (996 * _MS, "1.00s"),
+        (3 * _S + 450 * _MS, "3.45s"),
+        (59_994 * _MS, "59.99s"),
+        (59_996 * _MS, "1m 0.00s"),
+        (61 * _S + 4 * _MS, "1m 1.00s"),
+        (3599_994 * _MS, "59m 59.99s"),
+        (3599_996 * _MS, "1h 0.00s"),
+        (3723 * _S + 450 * _MS, "1h 2m 3.45s"),
+    ],
+)
+def test_format_elapsed(elapsed_ns, expected):
+    """Rounding carries into minutes and hours; zero units are left out."""
+    assert _format_elapsed(elapsed_ns) == expected